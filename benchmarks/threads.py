@@ -0,0 +1,81 @@
+"""Throughput of ``pydtype.translate`` against number of threads and processes.
+
+Run ``python benchmarks/threads.py``. On a free-threaded CPython build, throughput
+should grow with the number of threads up to the number of cores; on GIL builds it
+stays flat, and the process pool shows the reference scaling.
+
+"""
+
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import List, Tuple
+
+import pydtype
+from pydtype.testing import corpus
+from pydtype.validation import try_translate
+
+# Same seeded corpus as benchmarks/translate.py, without specs the target can't express
+SPECS = [
+    args
+    for args in [
+        *((s, "numpy", "struct") for s in corpus("numpy", 50, 0, 20, portable=True)),
+        *((s, "struct", "numpy") for s in corpus("struct", 50, 0, 20)),
+    ]
+    if try_translate(*args).ok
+]
+
+
+def work(n: int) -> int:
+    for i in range(n):
+        pydtype.translate(*SPECS[i % len(SPECS)])
+    return n
+
+
+def measure(executor: Executor, workers: int, n: int) -> float:
+    # Warm up the workers, so that process start-up isn't measured
+    list(executor.map(work, [1] * workers))
+    start = time.perf_counter()
+    done = sum(executor.map(work, [n] * workers))
+    return done / (time.perf_counter() - start)
+
+
+def run(workers: List[int], n: int, processes: bool) -> List[Tuple[str, int, float]]:
+    pools = [("thread", ThreadPoolExecutor)]
+    if processes:
+        pools.append(("process", ProcessPoolExecutor))
+
+    results = []
+    for kind, Pool in pools:
+        for w in workers:
+            with Pool(w) as executor:
+                results.append((kind, w, measure(executor, w, n)))
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--workers", default="1,2,4,8,16,32,64", help="comma separated worker counts"
+    )
+    parser.add_argument("-n", type=int, default=20000, help="translations per worker")
+    parser.add_argument("--no-processes", action="store_true")
+    args = parser.parse_args()
+
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"Python {sys.version.split()[0]}, GIL {'enabled' if gil else 'disabled'}")
+    print(f"{os.cpu_count()} CPUs\n")
+    print(f"{'pool':>8} {'workers':>8} {'translations/s':>16} {'scaling':>8}")
+
+    workers = [int(w) for w in args.workers.split(",")]
+    baseline = {}
+    for kind, w, throughput in run(workers, args.n, not args.no_processes):
+        baseline.setdefault(kind, throughput)
+        scaling = throughput / baseline[kind]
+        print(f"{kind:>8} {w:>8} {throughput:>16,.0f} {scaling:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""Time of decode, encode and translate on the seeded random corpus.
+
+Run ``python benchmarks/translate.py``. The corpus is the one verified by
+``pydtype.testing.check``, so optimizations are measured on the same inputs they're
+tested with; pass ``--check`` to verify them in the same run.
+
+"""
+
+import argparse
+import time
+from typing import Callable, List
+
+from pydtype import testing
+from pydtype.translator import framework, translate
+
+TARGETS = {"numpy": "struct", "struct": "numpy"}
+
+
+def n_fields(decoded: list) -> int:
+    return sum(not isinstance(s, str) for s in decoded)
+
+
+def best_of(repeat: int, func: Callable[[], object]) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def run(from_: str, specs: List[str], repeat: int) -> None:
+    parser, to = framework[from_], TARGETS[from_]
+    decoded = [parser.decode(s) for s in specs]
+    fields = sum(n_fields(d) for d in decoded)
+    translatable = []
+    for spec in specs:
+        try:
+            translate(spec, from_, to)
+            translatable.append(spec)
+        except ValueError:
+            pass
+
+    stages = {
+        "decode": (lambda: [parser.decode(s) for s in specs], fields),
+        "encode": (lambda: [parser.encode(*d) for d in decoded], fields),
+        f"translate->{to}": (
+            lambda: [translate(s, from_, to) for s in translatable],
+            sum(n_fields(parser.decode(s)) for s in translatable),
+        ),
+    }
+    for stage, (func, n) in stages.items():
+        elapsed = best_of(repeat, func)
+        rate = n / elapsed if elapsed > 0 else float("inf")
+        ms = elapsed * 1e3
+        print(f"{from_:>8} {stage:>20} {ms:>10.2f} ms {rate:>14,.0f} fields/s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=200, help="specs per framework")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--max-fields", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--portable", action="store_true")
+    parser.add_argument("--check", action="store_true")
+    args = parser.parse_args()
+
+    for from_ in TARGETS:
+        specs = testing.corpus(
+            from_, args.size, args.seed, args.max_fields, portable=args.portable
+        )
+        if args.check:
+            for spec in specs:
+                testing.check(spec, from_)
+        run(from_, specs, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""Throughput of translation on clean and error-heavy streams.
+
+Run ``python benchmarks/validation.py``. A share of the seeded corpus is corrupted,
+then the stream is translated by ``translate`` catching its errors, and by
+``try_translate`` which returns them.
+
+"""
+
+import argparse
+import random
+import time
+from typing import Callable, List
+
+from pydtype import testing
+from pydtype.translator import translate
+from pydtype.validation import try_translate
+
+
+def corrupt(specs: List[str], ratio: float, seed: int) -> List[str]:
+    rng = random.Random(seed)
+    return [f"{s},zz" if rng.random() < ratio else s for s in specs]
+
+
+def raising(specs: List[str]) -> None:
+    for spec in specs:
+        try:
+            translate(spec, "numpy", "struct")
+        except ValueError:
+            pass
+
+
+def returning(specs: List[str]) -> None:
+    for spec in specs:
+        try_translate(spec, "numpy", "struct")
+
+
+def best_of(repeat: int, func: Callable[[], object]) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--max-fields", type=int, default=4)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    specs = testing.corpus("numpy", args.size, args.seed, args.max_fields)
+    for ratio in (0.0, 0.1, 0.5):
+        stream = corrupt(specs, ratio, args.seed)
+        for name, func in [("translate", raising), ("try_translate", returning)]:
+            elapsed = best_of(args.repeat, lambda: func(stream))
+            rate = len(stream) / elapsed
+            print(f"{ratio:>5.0%} invalid {name:>14} {rate:>14,.0f} specs/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -10,4 +10,7 @@ except:  # noqa: E722
 
 
 # Alias
+from .builder import SpecBuilder  # noqa: F401
+from .inference import infer  # noqa: F401
+from .records import pack_records  # noqa: F401
 from .translator import translate  # noqa: F401
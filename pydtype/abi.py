@@ -0,0 +1,57 @@
+"""Sizes of C native types on target platforms.
+
+Native types such as ``long`` in NumPy, ctypes and array are sized for the host by
+default, and in struct by its standard sizes. Tables derived for a profile here let
+specs of data produced on other platforms be translated without running there.
+
+Profiles only give sizes. Offsets of aligned layouts, as in native mode of struct,
+align every type to its size as x86-64 and AArch64 do; other ABIs may align less,
+e.g. i386 System V aligns ``double`` and ``long long`` to 4 bytes.
+
+Examples
+--------
+>>> translate("@lq", "struct", "numpy", abi="llp64")
+'=i4,=i8'
+>>> StructParser.with_abi("lp64").decode("l")
+[(StructFormat(common_name='long', character='l', kind='int', byte_size=8), ())]
+
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Union
+
+
+@dataclass(frozen=True)
+class ABI:
+    """Size in bytes of each C native type."""
+
+    name: str
+    short: int
+    int: int
+    long: int
+    long_long: int
+    size_t: int
+    pointer: int
+    long_double: int
+
+
+PROFILES: Dict[str, ABI] = {
+    # Linux and other Unix on x86-64 or AArch64, and macOS on x86-64
+    "lp64": ABI("lp64", 2, 4, 8, 8, 8, 8, 16),
+    # macOS and iOS on arm64, where long double is the same as double
+    "darwin-arm64": ABI("darwin-arm64", 2, 4, 8, 8, 8, 8, 8),
+    # 64-bit Windows
+    "llp64": ABI("llp64", 2, 4, 4, 8, 8, 8, 8),
+    # 32-bit x86 System V, e.g. Linux on i386
+    "ilp32": ABI("ilp32", 2, 4, 4, 8, 4, 4, 12),
+}
+
+
+def profile(abi: Union[str, ABI]) -> ABI:
+    """Profile of the name, or the ABI itself."""
+    if isinstance(abi, ABI):
+        return abi
+    try:
+        return PROFILES[abi.lower()]
+    except KeyError:
+        raise ValueError(f"Unknown ABI {abi!r}, available: {list(PROFILES)}")
@@ -0,0 +1,45 @@
+"""Read fixed-layout records from asyncio streams."""
+
+import asyncio
+from typing import Any, AsyncIterator, List, Tuple
+
+from .records import compile_struct
+
+
+async def read_records(
+    reader: asyncio.StreamReader, spec: str, from_: str, batch_size: int = 1024
+) -> AsyncIterator[List[Tuple[Any, ...]]]:
+    """Iterate over batches of records read from a stream.
+
+    Up to ``batch_size`` records are awaited with a single ``readexactly`` call and
+    unpacked at once. Nothing is read ahead of the consumer, so a slow consumer
+    applies backpressure to the sender through the stream's flow control.
+
+    Raises
+    ------
+    asyncio.IncompleteReadError
+        If the stream ends in the middle of a record. Complete records received
+        before that are yielded first.
+
+    Examples
+    --------
+    >>> async for batch in read_records(reader, "<id", "struct"):
+    ...     for index, value in batch:
+    ...         ...
+
+    """
+    fmt = compile_struct(spec, from_.lower())
+    if fmt.size == 0:
+        raise ValueError(f"Record {spec!r} has no size")
+
+    while True:
+        try:
+            data = await reader.readexactly(batch_size * fmt.size)
+        except asyncio.IncompleteReadError as e:
+            complete = len(e.partial) - len(e.partial) % fmt.size
+            if complete > 0:
+                yield list(fmt.iter_unpack(e.partial[:complete]))
+            if complete < len(e.partial):
+                raise
+            return
+        yield list(fmt.iter_unpack(data))
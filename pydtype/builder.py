@@ -0,0 +1,162 @@
+"""Build a spec field by field, without re-parsing what's already built."""
+
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, Union
+
+from .core import Specifier
+from .core.record import align, nbytes
+from .translator import framework
+from .typing import Shape
+
+Entry = Tuple[Specifier, Shape]
+
+
+class SpecBuilder:
+    """Growable list of decoded fields, with layout and encoded specs kept current.
+
+    Appending a field takes constant time; its offset follows the end of the last
+    field, and it's encoded only to the frameworks ``encode`` was already called
+    for. Inserting or removing a field re-lays the fields after it out, but doesn't
+    re-encode any other field.
+
+    Parameters
+    ----------
+    endian
+        Byte order of the spec, as the first element of decoded spec.
+    aligned
+        If True, fields are aligned as in native mode of struct, instead of packed.
+
+    Examples
+    --------
+    >>> builder = SpecBuilder("<")
+    >>> builder.append(*NumPyTypes.find("i4"))
+    0
+    >>> builder.append(*NumPyTypes.find("(3,)f8"))
+    4
+    >>> builder.encode("numpy"), builder.encode("struct"), builder.itemsize
+    ('<i4,<(3,)f8', '<i3d', 28)
+
+    """
+
+    def __init__(self, endian: Optional[str] = None, aligned: bool = False) -> None:
+        self._endian, self._aligned = endian, aligned
+        self._entries: List[Entry] = []
+        self._offsets: List[int] = []
+        self._itemsize = 0
+        # Formats of each field and the joined spec, per (framework, strategy)
+        self._formats: Dict[Tuple[str, str], List[str]] = {}
+        self._joined: Dict[Tuple[str, str], str] = {}
+
+    @classmethod
+    def decode(cls, spec: str, from_: str) -> "SpecBuilder":
+        """Start from an existing spec, keeping its byte order and alignment."""
+        parser = framework[from_.lower()]
+        decoded = parser.decode(spec)
+        endian = decoded[0] if isinstance(decoded[0], str) else None
+        self = cls(endian, aligned=parser.aligned(decoded))
+        for specifier, shape in (s for s in decoded if not isinstance(s, str)):
+            self.append(specifier, shape)
+        return self
+
+    @property
+    def endian(self) -> Optional[str]:
+        return self._endian
+
+    @endian.setter
+    def endian(self, endian: Optional[str]) -> None:
+        # Fields are encoded without byte order, so only the joined specs go stale
+        self._endian = endian
+        self._joined.clear()
+
+    @property
+    def aligned(self) -> bool:
+        return self._aligned
+
+    @property
+    def offsets(self) -> Tuple[int, ...]:
+        return tuple(self._offsets)
+
+    @property
+    def itemsize(self) -> int:
+        return self._itemsize
+
+    @property
+    def decoded(self) -> List[Union[str, Entry]]:
+        """Fields in the form ``Parser.decode`` returns."""
+        endian = [] if self._endian is None else [self._endian]
+        return endian + self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __getitem__(self, index: int) -> Entry:
+        return self._entries[index]
+
+    def __iter__(self) -> Iterator[Entry]:
+        return iter(self._entries)
+
+    def append(self, specifier: Specifier, shape: Shape = ()) -> int:
+        """Add a field to the end, returning its offset."""
+        entry = (specifier, tuple(shape))
+        offset = align(self._itemsize, specifier, self._aligned)
+        self._entries.append(entry)
+        self._offsets.append(offset)
+        self._itemsize = offset + nbytes(*entry)
+        self._update(lambda key, formats: formats.append(_encode(key, entry)))
+        return offset
+
+    def insert(self, index: int, specifier: Specifier, shape: Shape = ()) -> int:
+        """Add a field before ``index``, returning its offset."""
+        entry = (specifier, tuple(shape))
+        n = len(self._entries)
+        # Clip the index as ``list.insert`` does
+        index = min(index, n) if index >= 0 else max(index + n, 0)
+        self._entries.insert(index, entry)
+        self._relayout(index)
+        self._update(lambda key, formats: formats.insert(index, _encode(key, entry)))
+        return self._offsets[index]
+
+    def pop(self, index: int = -1) -> Entry:
+        """Remove a field and return it."""
+        n = len(self._entries)
+        entry = self._entries.pop(index)
+        index %= n
+        self._relayout(index)
+        self._update(lambda key, formats: formats.pop(index))
+        return entry
+
+    def encode(self, to: str, strategy: str = "exact") -> str:
+        """Spec in a framework; only fields added since the last call are encoded."""
+        key = (to.lower(), strategy)
+        if key not in self._joined:
+            if key not in self._formats:
+                self._formats[key] = [_encode(key, e) for e in self._entries]
+            self._joined[key] = framework[key[0]].join(self._endian, self._formats[key])
+        return self._joined[key]
+
+    def _relayout(self, start: int) -> None:
+        offset = 0
+        if start > 0:
+            offset = self._offsets[start - 1] + nbytes(*self._entries[start - 1])
+        del self._offsets[start:]
+        for specifier, shape in self._entries[start:]:
+            offset = align(offset, specifier, self._aligned)
+            self._offsets.append(offset)
+            offset += nbytes(specifier, shape)
+        self._itemsize = offset
+
+    def _update(self, edit: Callable[[Tuple[str, str], List[str]], None]) -> None:
+        self._joined.clear()
+        for key, formats in list(self._formats.items()):
+            try:
+                edit(key, formats)
+            except ValueError:
+                # Not expressible anymore; next ``encode`` re-raises the error
+                del self._formats[key]
+
+
+def _encode(key: Tuple[str, str], entry: Entry) -> str:
+    to, strategy = key
+    try:
+        return framework[to].encode(entry, strategy=strategy)
+    except StopIteration:
+        raise ValueError(f"Cannot encode {entry[0]} to {to} in {strategy} mode.")
@@ -1,3 +1,4 @@
 from .parser import Parser  # noqa: F401
+from .record import Field, Record  # noqa: F401
 from .specifier import Specifier  # noqa: F401
 from .types import Types  # noqa: F401
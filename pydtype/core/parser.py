@@ -1,13 +1,29 @@
+import threading
 from abc import ABC, abstractmethod
-from typing import ClassVar, List, Tuple, Union
+from typing import ClassVar, Dict, List, Optional, Tuple, Type, Union
 
 from .specifier import Specifier
+from .types import Types
+from ..abi import ABI, profile
 from ..typing import Shape
 
+Token = Tuple[int, str]
+
+
+def split_tokens(spec: str, offset: int = 0) -> List[Token]:
+    """Split by comma, returning each stripped part with its position."""
+    tokens, start = [], offset
+    for part in spec.split(","):
+        tokens.append((start + len(part) - len(part.lstrip()), part.strip()))
+        start += len(part) + 1
+    return tokens
+
 
 class Parser(ABC):
 
     framework: ClassVar[str]
+    table: ClassVar[Type[Types]]
+    abi: ClassVar[Optional[ABI]] = None
 
     @classmethod
     @abstractmethod
@@ -18,3 +34,61 @@ class Parser(ABC):
     @abstractmethod
     def decode(cls, spec: str) -> List[Union[str, Tuple[Specifier, Shape]]]:
         ...
+
+    @classmethod
+    def tokenize(cls, spec: str) -> Tuple[Optional[str], List[Token]]:
+        """Byte order and unchecked tokens of fields, with their positions in spec.
+
+        Looking each token up in ``table`` gives the fields ``decode`` returns, so
+        invalid specs can be located without raising. Byte order marks that cannot
+        be honoured are returned as tokens, which no type matches.
+
+        """
+        raise NotImplementedError
+
+    @classmethod
+    def with_abi(cls, abi: Union[str, ABI, None]) -> Type["Parser"]:
+        """Parser whose native types are sized for a target ABI, not for the host.
+
+        The class is cached, so it can be kept and reused as a compiled translator,
+        and is the same one also when threads miss the cache at once.
+
+        """
+        if abi is None:
+            return cls
+        return _with_abi(cls, profile(abi))
+
+    @classmethod
+    def aligned(cls, decoded: List[Union[str, Tuple[Specifier, Shape]]]) -> bool:
+        """Whether fields of decoded spec are aligned as in C, instead of packed."""
+        return False
+
+    @classmethod
+    def join(cls, endian: Optional[str], formats: List[str]) -> str:
+        """Combine formats of fields encoded one by one into a spec.
+
+        ``encode`` of the whole spec equals ``join`` of the fields encoded without
+        byte order, so the formats can be cached and reused. By default fields are
+        separated by comma and byte order is dropped, for frameworks of fixed byte
+        order.
+
+        """
+        return ",".join(formats)
+
+
+_parsers: Dict[Tuple[Type[Parser], ABI], Type[Parser]] = {}
+_parsers_lock = threading.Lock()
+
+
+def _with_abi(cls: Type[Parser], abi: ABI) -> Type[Parser]:
+    key = (cls, abi)
+    parser = _parsers.get(key)
+    if parser is None:
+        # Checked again under the lock, so that only one class is ever created
+        with _parsers_lock:
+            parser = _parsers.get(key)
+            if parser is None:
+                attrs = {"abi": abi, "table": cls.table.with_abi(abi)}
+                parser = type(f"{cls.__name__}[{abi.name}]", (cls,), attrs)
+                _parsers[key] = parser
+    return parser
@@ -0,0 +1,88 @@
+from dataclasses import dataclass
+from functools import reduce
+from operator import mul
+from typing import List, Optional, Tuple, Union
+
+from .specifier import Specifier
+from ..typing import Shape
+
+
+def nbytes(specifier: Specifier, shape: Shape) -> int:
+    """Size of a (possibly array) element, without any padding."""
+    if specifier.byte_size is None:
+        raise ValueError(f"Size of {specifier.common_name} is unknown")
+    return specifier.byte_size * reduce(mul, shape, 1)
+
+
+def align(offset: int, specifier: Specifier, aligned: bool = False) -> int:
+    """Offset of an element placed at or after ``offset``."""
+    if aligned and ((specifier.byte_size or 0) > 1):
+        return offset + (-offset % specifier.byte_size)
+    return offset
+
+
+def layout(
+    *spec: Tuple[Specifier, Shape], aligned: bool = False
+) -> Tuple[List[int], int]:
+    """Offsets of the fields and size of the whole record.
+
+    Aligned layout follows native mode of struct; each element is aligned to its
+    size, without padding at the end.
+
+    """
+    offsets, offset = [], 0
+    for specifier, shape in spec:
+        offset = align(offset, specifier, aligned)
+        offsets.append(offset)
+        offset += nbytes(specifier, shape)
+    return offsets, offset
+
+
+@dataclass(frozen=True)
+class Field:
+
+    name: str
+    offset: int
+    specifier: Union[Specifier, "Record"]
+    shape: Shape = ()
+    endian: Optional[str] = None
+
+    @property
+    def itemsize(self) -> int:
+        if isinstance(self.specifier, Record):
+            return self.specifier.itemsize * reduce(mul, self.shape, 1)
+        return nbytes(self.specifier, self.shape)
+
+
+@dataclass(frozen=True)
+class Record:
+    """Tree of named fields with explicit offsets.
+
+    Notes
+    -----
+    Offset of each field is relative to the start of the record it belongs to, and
+    ``itemsize`` may exceed the end of the last field to express trailing padding.
+
+    """
+
+    fields: Tuple[Field, ...]
+    itemsize: int
+
+    @classmethod
+    def packed(cls, *fields: Tuple[str, Union[Specifier, "Record"], Shape, str]):
+        """Lay the fields out sequentially, with no padding between them."""
+        offset, _fields = 0, []
+        for name, specifier, shape, endian in fields:
+            field = Field(name, offset, specifier, tuple(shape), endian)
+            _fields.append(field)
+            offset += field.itemsize
+        return cls(tuple(_fields), offset)
+
+    @property
+    def is_packed(self) -> bool:
+        offset = 0
+        for field in self.fields:
+            if field.offset != offset:
+                return False
+            offset += field.itemsize
+        return offset == self.itemsize
@@ -5,8 +5,9 @@ from typing import ClassVar, Optional
 from ..typing import Shape
 
 
-@dataclass
+@dataclass(frozen=True)
 class Specifier(ABC):
+    """Immutable, so the tables of ``Types`` can be shared between threads."""
 
     framework: ClassVar[str]
     reference: ClassVar[str]
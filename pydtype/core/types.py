@@ -1,6 +1,10 @@
-from typing import Any, Callable, ClassVar, Sequence, Tuple
+import threading
+from dataclasses import replace
+from typing import Any, Callable, ClassVar, Dict, Optional, Sequence, Tuple, Type
 
 from .specifier import Specifier
+from ..abi import ABI
+from ..instrumentation import timed
 from ..typing import Shape
 
 
@@ -8,36 +12,97 @@ class Types:
 
     types: ClassVar[Sequence[Specifier]]
     framework: ClassVar[str]
+    # Character of C native types, to the name of its size in ``ABI``
+    native: ClassVar[Dict[str, str]] = {}
+
+    @classmethod
+    def with_abi(cls, abi: ABI) -> Type["Types"]:
+        """Table of the same types, native ones sized for the ABI."""
+        return _with_abi(cls, abi)
 
     @classmethod
     def search(cls, kind: str, byte_size: int, strategy: str = "exact") -> Specifier:
         same_kind = [x for x in cls.types if x.kind == kind]
         return match(byte_size, same_kind, lambda x: x.byte_size, strategy)
 
+    @classmethod
+    def get(
+        cls, kind: str, byte_size: int, strategy: str = "exact"
+    ) -> Optional[Specifier]:
+        """Same as ``search``, but returns None if no type matches."""
+        same_kind = [x for x in cls.types if x.kind == kind]
+        return match(byte_size, same_kind, lambda x: x.byte_size, strategy, None)
+
     @classmethod
     def find(cls, spec: str) -> Tuple[Specifier, Shape]:
+        found = cls.lookup(spec)
+        if found is None:
+            raise ValueError(f"Specifier {spec} is not supported")
+        return found
+
+    @classmethod
+    @timed("find")
+    def lookup(cls, spec: str) -> Optional[Tuple[Specifier, Shape]]:
+        """Same as ``find``, but returns None if the spec isn't supported."""
         for t in cls.types:
             shape = t.ident(spec)
             if shape is not None:
                 return t, shape
-        raise ValueError(f"Specifier {spec} is not supported")
 
 
+@timed("match")
 def match(
     target: Any,
     candidates: Sequence[Any],
     extractor: Callable[[Any], Any] = lambda x: x,
     strategy: str = "exact",
+    *default: Any,
 ) -> Any:
+    """Pick a candidate by a strategy.
+
+    No candidate left raises StopIteration, unless ``default`` is given.
+
+    """
     strategy = strategy.lower()
 
     if strategy == "exact":
-        return next(x for x in candidates if extractor(x) == target)
+        return next((x for x in candidates if extractor(x) == target), *default)
+
+    # Entries of unknown size cannot be compared.
+    candidates = [x for x in candidates if extractor(x) is not None]
     if strategy == "closest":
-        return sorted(candidates, key=lambda x: abs(extractor(x) - target))[0]
-    if strategy == "leaky":
+        _candidates = candidates
+    elif strategy == "leaky":
         _candidates = filter(lambda x: extractor(x) <= target, candidates)
-        return sorted(_candidates, key=lambda x: abs(extractor(x) - target))[0]
-    if strategy == "contain":
+    elif strategy == "contain":
         _candidates = filter(lambda x: extractor(x) >= target, candidates)
-        return sorted(_candidates, key=lambda x: abs(extractor(x) - target))[0]
+    else:
+        return
+    ranked = sorted(_candidates, key=lambda x: abs(extractor(x) - target))
+    return next(iter(ranked), *default)
+
+
+_tables: Dict[Tuple[Type[Types], ABI], Type[Types]] = {}
+_tables_lock = threading.Lock()
+
+
+def _with_abi(cls: Type[Types], abi: ABI) -> Type[Types]:
+    key = (cls, abi)
+    table = _tables.get(key)
+    if table is None:
+        # Checked again under the lock, so that only one class is ever created
+        with _tables_lock:
+            table = _tables.get(key)
+            if table is None:
+                table = _tables[key] = _derive(cls, abi)
+    return table
+
+
+def _derive(cls: Type[Types], abi: ABI) -> Type[Types]:
+    types = tuple(
+        replace(t, byte_size=getattr(abi, cls.native[t.character]))
+        if t.character in cls.native
+        else t
+        for t in cls.types
+    )
+    return type(f"{cls.__name__}[{abi.name}]", (cls,), {"types": types})
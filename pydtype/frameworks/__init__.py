@@ -1,2 +1,6 @@
+from .array import ArrayParser  # noqa: F401
+from .arrow import ArrowParser  # noqa: F401
+from .ctypes import CTypesParser  # noqa: F401
+from .fits import FITSParser  # noqa: F401
 from .numpy import NumPyParser  # noqa: F401
 from .struct import StructParser  # noqa: F401
@@ -0,0 +1,103 @@
+"""Type codes in array, Python standard library."""
+
+import array
+import sys
+from typing import List, Optional, Tuple, Union
+
+from ..core import Parser, Specifier, Types
+from ..core.parser import Token
+from ..typing import Shape
+
+NATIVE_ORDER = "<" if sys.byteorder == "little" else ">"
+
+
+class ArrayFormat(Specifier):
+
+    framework = "array"
+    reference = "https://docs.python.org/3/library/array.html"
+
+    def with_shape(self, *shape: int) -> str:
+        """Return a type code, shape of which is held by the array object itself."""
+        return self.character
+
+    def ident(self, spec: str) -> Optional[Shape]:
+        if spec == self.character:
+            return tuple()
+
+
+class ArrayTypes(Types):
+
+    framework = "array"
+    types = tuple(
+        ArrayFormat(name, code, kind, array.array(code).itemsize)
+        for name, code, kind in [
+            ("signed char", "b", "int"),
+            ("unsigned char", "B", "uint"),
+            ("signed short", "h", "int"),
+            ("unsigned short", "H", "uint"),
+            ("signed int", "i", "int"),
+            ("unsigned int", "I", "uint"),
+            ("signed long", "l", "int"),
+            ("unsigned long", "L", "uint"),
+            ("signed long long", "q", "int"),
+            ("unsigned long long", "Q", "uint"),
+            ("float", "f", "float"),
+            ("double", "d", "float"),
+        ]
+    )
+    native = {
+        **dict.fromkeys("hH", "short"),
+        **dict.fromkeys("iI", "int"),
+        **dict.fromkeys("lL", "long"),
+        **dict.fromkeys("qQ", "long_long"),
+    }
+
+
+class ArrayParser(Parser):
+    """Type code of homogeneous array, in native byte order and size."""
+
+    framework = "array"
+    table = ArrayTypes
+
+    @classmethod
+    def encode(cls, *spec: Tuple[Specifier, Shape], strategy: str = "exact") -> str:
+        endian = None
+        if spec and isinstance(spec[0], str):
+            endian, *spec = spec
+
+        codes = [
+            cls.table.search(s.kind, s.byte_size, strategy).with_shape()
+            for s, _ in spec
+        ]
+        return cls.join(endian, codes)
+
+    @classmethod
+    def join(cls, endian: Optional[str], formats: List[str]) -> str:
+        endian = {"!": ">"}.get(endian, endian)
+        if endian in ("<", ">") and endian != NATIVE_ORDER:
+            raise ValueError(f"Non-native byte order {endian} isn't supported")
+        codes = set(formats)
+        if len(codes) != 1:
+            raise ValueError("Heterogeneous spec cannot be expressed by a type code")
+        return codes.pop()
+
+    @classmethod
+    def decode(cls, spec: str) -> List[Union[str, Tuple[Specifier, Shape]]]:
+        return ["=", cls.table.find(spec.strip())]
+
+    @classmethod
+    def tokenize(cls, spec: str) -> Tuple[Optional[str], List[Token]]:
+        return "=", [(len(spec) - len(spec.lstrip()), spec.strip())]
+
+
+def cast(buffer, spec: str, from_: str) -> memoryview:
+    """Reinterpret a homogeneous buffer in place, without copying.
+
+    Examples
+    --------
+    >>> cast(shared_memory.buf, "(64,)f8", "numpy").tolist()
+
+    """
+    from ..translator import translate
+
+    return memoryview(buffer).cast("B").cast(translate(spec, from_, "array"))
@@ -0,0 +1,188 @@
+"""Format strings of Arrow C data interface."""
+
+import re
+import sys
+from typing import List, Optional, Tuple, Union
+
+from ..core import Parser, Record, Specifier, Types
+from ..core.parser import Token
+from ..typing import Shape
+
+
+def split(spec: str) -> List[str]:
+    """Split comma separated children, ignoring commas nested in braces."""
+    return [child for _, child in _split(spec)]
+
+
+def _split(spec: str, offset: int = 0) -> List[Token]:
+    children, depth, start = [], 0, 0
+    for i, char in enumerate(spec + ","):
+        if char == "{":
+            depth += 1
+        elif char == "}":
+            depth -= 1
+        elif (char == ",") and (depth == 0):
+            child = spec[start:i]
+            position = offset + start + len(child) - len(child.lstrip())
+            children.append((position, child.strip()))
+            start = i + 1
+    return children
+
+
+def peel(spec: str) -> Tuple[Shape, str]:
+    """Unwrap fixed-size lists ``+w:N{child}``, returning their sizes and the child."""
+    shape = []
+    while True:
+        parsed = re.fullmatch(r"\+w:(\d+)\{(.*)\}", spec.strip())
+        if parsed is None:
+            return tuple(shape), spec.strip()
+        shape.append(int(parsed[1]))
+        spec = parsed[2]
+
+
+def wrap(child: str, *shape: int) -> str:
+    for size in reversed(shape):
+        child = f"+w:{size}{{{child}}}"
+    return child
+
+
+class ArrowFormat(Specifier):
+
+    framework = "arrow"
+    reference = "https://arrow.apache.org/docs/format/CDataInterface.html"
+
+    def with_shape(self, *shape: int) -> str:
+        """Return a format, wrapped in fixed-size lists for array.
+
+        Notes
+        -----
+        Arrow schemas keep children in separate nodes; here the children are written
+        in braces after the parent, e.g. ``+w:3{g}`` is a fixed-size list of 3
+        float64.
+
+        """
+        if self.kind == "bytes":
+            length, *shape = shape if len(shape) > 0 else (1,)
+            return wrap(f"w:{length}", *shape)
+        return wrap(self.character, *shape)
+
+    def ident(self, spec: str) -> Optional[Shape]:
+        shape, child = peel(spec)
+        if self.kind == "bytes":
+            parsed = re.fullmatch(r"w:(\d+)", child)
+            if parsed is not None:
+                return (int(parsed[1]), *shape)
+        elif child == self.character:
+            return shape
+
+
+class ArrowTypes(Types):
+
+    framework = "arrow"
+    types = (
+        ArrowFormat("null", "n", "null", None),
+        # Bit-packed, so not interchangeable with byte-sized bool of other frameworks
+        ArrowFormat("boolean", "b", "bool", None),
+        ArrowFormat("int8", "c", "int", 1),
+        ArrowFormat("uint8", "C", "uint", 1),
+        ArrowFormat("int16", "s", "int", 2),
+        ArrowFormat("uint16", "S", "uint", 2),
+        ArrowFormat("int32", "i", "int", 4),
+        ArrowFormat("uint32", "I", "uint", 4),
+        ArrowFormat("int64", "l", "int", 8),
+        ArrowFormat("uint64", "L", "uint", 8),
+        ArrowFormat("float16", "e", "float", 2),
+        ArrowFormat("float32", "f", "float", 4),
+        ArrowFormat("float64", "g", "float", 8),
+        ArrowFormat("fixed-size binary", "w", "bytes", 1),
+        # Variable length, so have no fixed size nor counterpart in other frameworks
+        ArrowFormat("binary", "z", "binary", None),
+        ArrowFormat("large binary", "Z", "large binary", None),
+        ArrowFormat("utf-8 string", "u", "utf8", None),
+        ArrowFormat("large utf-8 string", "U", "large utf8", None),
+    )
+
+
+class ArrowParser(Parser):
+    """Formats of children of a struct, separated by comma e.g. ``i,+w:3{g},w:16``.
+
+    The enclosing struct may also be written explicitly as ``+s{i,+w:3{g},w:16}``.
+    Arrow buffers are little-endian, so decoded spec starts with ``<``.
+
+    """
+
+    framework = "arrow"
+    table = ArrowTypes
+
+    @classmethod
+    def encode(cls, *spec: Tuple[Specifier, Shape], strategy: str = "exact") -> str:
+        endian = None
+        if spec and isinstance(spec[0], str):
+            endian, *spec = spec
+
+        formats = [
+            cls.table.search(s.kind, s.byte_size, strategy).with_shape(*shape)
+            for s, shape in spec
+        ]
+        return cls.join(endian, formats)
+
+    @classmethod
+    def join(cls, endian: Optional[str], formats: List[str]) -> str:
+        _check_byte_order(endian)
+        return ",".join(formats)
+
+    @classmethod
+    def decode(cls, spec: str) -> List[Union[str, Tuple[Specifier, Shape]]]:
+        return ["<"] + [cls.table.find(s) for s in split(_unwrap_struct(spec))]
+
+    @classmethod
+    def tokenize(cls, spec: str) -> Tuple[Optional[str], List[Token]]:
+        inner, start = _unwrap_struct(spec), len(spec) - len(spec.lstrip())
+        if inner != spec.strip():
+            start += len("+s{")
+        return "<", _split(inner, start)
+
+    @classmethod
+    def decode_record(cls, spec: str) -> Record:
+        """Decode including nested structs, named ``f0``, ``f1``, ..."""
+        fields = []
+        for i, child in enumerate(split(_unwrap_struct(spec))):
+            shape, inner = peel(child)
+            if inner.startswith("+s{"):
+                fields.append((f"f{i}", cls.decode_record(inner), shape, None))
+            else:
+                fields.append((f"f{i}", *cls.table.find(child), "<"))
+        return Record.packed(*fields)
+
+    @classmethod
+    def encode_record(cls, record: Record, strategy: str = "exact") -> str:
+        """Encode children of a record; nested records become ``+s{...}``.
+
+        Arrow keeps each child in its own buffer, so offsets are not encoded.
+
+        """
+        formats = []
+        for field in record.fields:
+            _check_byte_order(field.endian)
+            if isinstance(field.specifier, Record):
+                inner = cls.encode_record(field.specifier, strategy)
+                formats.append(wrap(f"+s{{{inner}}}", *field.shape))
+            else:
+                s = field.specifier
+                fmt = cls.table.search(s.kind, s.byte_size, strategy)
+                formats.append(fmt.with_shape(*field.shape))
+        return ",".join(formats)
+
+
+def _unwrap_struct(spec: str) -> str:
+    spec = spec.strip()
+    if spec.startswith("+s{") and spec.endswith("}") and len(split(spec)) == 1:
+        return spec[3:-1]
+    return spec
+
+
+def _check_byte_order(endian: Optional[str]) -> None:
+    native = "<" if sys.byteorder == "little" else ">"
+    endian = {"!": ">", "=": native, "@": native}.get(endian, endian)
+    if endian == ">":
+        raise ValueError("Arrow buffers are little-endian")
@@ -0,0 +1,182 @@
+"""Fundamental data types in ctypes, Python standard library."""
+
+import ctypes
+import re
+import threading
+from typing import Dict, List, Optional, Tuple, Type, Union
+
+from ..core import Parser, Specifier, Types
+from ..core.parser import Token, split_tokens
+from ..typing import Shape
+
+
+class CTypesFormat(Specifier):
+
+    framework = "ctypes"
+    reference = "https://docs.python.org/3/library/ctypes.html#fundamental-data-types"
+
+    def with_shape(self, *shape: int) -> str:
+        if self.kind == "bytes":
+            length, *shape = shape if len(shape) > 0 else (1,)
+            shape = [*shape, length]
+        return self.character + "".join(f"*{s}" for s in reversed(shape))
+
+    def ident(self, spec: str) -> Optional[Shape]:
+        parsed = re.findall(rf"^{re.escape(self.character)}((?:\s*\*\s*\d+)*)$", spec)
+        if len(parsed) == 0:
+            return
+        counts = tuple(map(int, re.findall(r"\d+", parsed[0])))
+        if self.kind == "bytes":
+            if len(counts) == 0:
+                return (1,)
+            return (counts[0], *reversed(counts[1:]))
+        return tuple(reversed(counts))
+
+    def ctype(self, *shape: int) -> type:
+        """Return the ctypes type, with array dimensions applied."""
+        spec = self.with_shape(*shape)
+        ctype = getattr(ctypes, self.character)
+        for count in re.findall(r"\d+", spec[len(self.character) :]):
+            ctype = ctype * int(count)
+        return ctype
+
+
+class CTypesTypes(Types):
+
+    framework = "ctypes"
+    types = (
+        CTypesFormat("bool", "c_bool", "bool", ctypes.sizeof(ctypes.c_bool)),
+        CTypesFormat("char[]", "c_char", "bytes", 1),
+        CTypesFormat("int8", "c_int8", "int", 1),
+        CTypesFormat("uint8", "c_uint8", "uint", 1),
+        CTypesFormat("int16", "c_int16", "int", 2),
+        CTypesFormat("uint16", "c_uint16", "uint", 2),
+        CTypesFormat("int32", "c_int32", "int", 4),
+        CTypesFormat("uint32", "c_uint32", "uint", 4),
+        CTypesFormat("int64", "c_int64", "int", 8),
+        CTypesFormat("uint64", "c_uint64", "uint", 8),
+        CTypesFormat("float", "c_float", "float", ctypes.sizeof(ctypes.c_float)),
+        CTypesFormat("double", "c_double", "float", ctypes.sizeof(ctypes.c_double)),
+        CTypesFormat(
+            "long double",
+            "c_longdouble",
+            "float",
+            ctypes.sizeof(ctypes.c_longdouble),
+        ),
+        # Platform dependent aliases
+        CTypesFormat("char", "c_char", "char", 1),
+        CTypesFormat("byte", "c_byte", "int", ctypes.sizeof(ctypes.c_byte)),
+        CTypesFormat("ubyte", "c_ubyte", "uint", ctypes.sizeof(ctypes.c_ubyte)),
+        CTypesFormat("short", "c_short", "int", ctypes.sizeof(ctypes.c_short)),
+        CTypesFormat("ushort", "c_ushort", "uint", ctypes.sizeof(ctypes.c_ushort)),
+        CTypesFormat("int", "c_int", "int", ctypes.sizeof(ctypes.c_int)),
+        CTypesFormat("uint", "c_uint", "uint", ctypes.sizeof(ctypes.c_uint)),
+        CTypesFormat("long", "c_long", "int", ctypes.sizeof(ctypes.c_long)),
+        CTypesFormat("ulong", "c_ulong", "uint", ctypes.sizeof(ctypes.c_ulong)),
+        CTypesFormat("longlong", "c_longlong", "int", ctypes.sizeof(ctypes.c_longlong)),
+        CTypesFormat(
+            "ulonglong", "c_ulonglong", "uint", ctypes.sizeof(ctypes.c_ulonglong)
+        ),
+        CTypesFormat("size_t", "c_size_t", "uint", ctypes.sizeof(ctypes.c_size_t)),
+        CTypesFormat("ssize_t", "c_ssize_t", "int", ctypes.sizeof(ctypes.c_ssize_t)),
+        CTypesFormat("void *", "c_void_p", "uint", ctypes.sizeof(ctypes.c_void_p)),
+    )
+    native = {
+        "c_longdouble": "long_double",
+        **dict.fromkeys(["c_short", "c_ushort"], "short"),
+        **dict.fromkeys(["c_int", "c_uint"], "int"),
+        **dict.fromkeys(["c_long", "c_ulong"], "long"),
+        **dict.fromkeys(["c_longlong", "c_ulonglong"], "long_long"),
+        **dict.fromkeys(["c_size_t", "c_ssize_t"], "size_t"),
+        "c_void_p": "pointer",
+    }
+
+
+class CTypesParser(Parser):
+    """Names of ctypes types separated by comma, e.g. ``c_int32,c_double*3``.
+
+    Byte order isn't part of the names; it's given by the base class of
+    ``ctypes.Structure``, see :func:`structure`.
+
+    """
+
+    framework = "ctypes"
+    table = CTypesTypes
+
+    @classmethod
+    def encode(cls, *spec: Tuple[Specifier, Shape], strategy: str = "exact") -> str:
+        if spec and isinstance(spec[0], str):
+            _, *spec = spec
+
+        formats = [
+            cls.table.search(s.kind, s.byte_size, strategy).with_shape(*shape)
+            for s, shape in spec
+        ]
+        return cls.join(None, formats)
+
+    @classmethod
+    def decode(cls, spec: str) -> List[Union[str, Tuple[Specifier, Shape]]]:
+        _, tokens = cls.tokenize(spec)
+        return [cls.table.find(s) for _, s in tokens]
+
+    @classmethod
+    def tokenize(cls, spec: str) -> Tuple[Optional[str], List[Token]]:
+        return None, split_tokens(spec)
+
+
+_structures: Dict[Tuple[str, str, str], Type[ctypes.Structure]] = {}
+_structures_lock = threading.Lock()
+
+
+def structure(spec: str, from_: str, strategy: str = "exact") -> Type[ctypes.Structure]:
+    """Return a ``ctypes.Structure`` subclass, fields of which are ``f0``, ``f1``, ...
+
+    The class is cached, so instances created by ``from_buffer`` on the same spec
+    share one type, also when threads miss the cache at once. Byte order of the spec
+    selects the base class. Fields are packed, except for struct format in native
+    mode, which follows C alignment rules.
+
+    Examples
+    --------
+    >>> Record = structure("<id", "struct")
+    >>> record = Record.from_buffer(shared_memory.buf)
+    >>> record.f1
+
+    """
+    key = (spec, from_.lower(), strategy)
+    cls = _structures.get(key)
+    if cls is None:
+        # Checked again under the lock, so that only one class is ever created
+        with _structures_lock:
+            cls = _structures.get(key)
+            if cls is None:
+                cls = _structures[key] = _structure(*key)
+    return cls
+
+
+def _structure(spec: str, from_: str, strategy: str) -> Type[ctypes.Structure]:
+    from ..translator import framework
+
+    decoded = framework[from_].decode(spec)
+    endian = None
+    if isinstance(decoded[0], str):
+        endian, *decoded = decoded
+
+    base = {
+        "<": ctypes.LittleEndianStructure,
+        ">": ctypes.BigEndianStructure,
+        "!": ctypes.BigEndianStructure,
+    }.get(endian, ctypes.Structure)
+    try:
+        fields = [
+            (f"f{i}", CTypesTypes.search(s.kind, s.byte_size, strategy).ctype(*shape))
+            for i, (s, shape) in enumerate(decoded)
+        ]
+    except StopIteration:
+        raise ValueError(
+            f"Cannot translate {spec} from {from_} to ctypes in {strategy} mode."
+        )
+    namespace = {"_fields_": fields}
+    if not framework[from_].aligned([endian] if endian else []):
+        namespace["_pack_"] = 1
+    return type("Structure", (base,), namespace)
@@ -0,0 +1,147 @@
+"""TFORM codes of binary table extension in FITS."""
+
+import re
+from functools import reduce
+from operator import mul
+from typing import Any, List, Optional, Tuple, Union
+
+from ..core import Parser, Specifier, Types
+from ..core.parser import Token, split_tokens
+from ..typing import Shape
+
+
+class FITSFormat(Specifier):
+
+    framework = "fits"
+    reference = "https://fits.gsfc.nasa.gov/standard40/fits_standard40aa-le.pdf"
+
+    def with_shape(self, *shape: int) -> str:
+        """Return a TFORM code for array.
+
+        Notes
+        -----
+        TFORM only carries the number of elements; the shape of multi-dimensional
+        arrays belongs to TDIMn keyword, so it's flattened here.
+
+        """
+        if len(shape) == 0:
+            return f"1{self.character}"
+        return f"{reduce(mul, shape, 1)}{self.character}"
+
+    def ident(self, spec: str) -> Optional[Shape]:
+        # Array descriptors may be followed by the element type and maximum length
+        suffix = r"(?:[LXBIJKAEDCM](?:\(\d+\))?)?" if self.kind == "descriptor" else ""
+        parsed = re.findall(rf"^(\d*){re.escape(self.character)}{suffix}$", spec)
+        if len(parsed) == 0:
+            return
+        repeat = int(parsed[0]) if parsed[0] else 1
+        if self.kind == "bytes":
+            return (repeat,)
+        return tuple() if repeat == 1 else (repeat,)
+
+
+class FITSTypes(Types):
+
+    framework = "fits"
+    types = (
+        # ASCII "T", "F" or NUL when undefined, so not interchangeable with C bool
+        FITSFormat("logical", "L", "logical", 1),
+        # Packed in whole bytes, so it has no size per element
+        FITSFormat("bit", "X", "bit", None),
+        FITSFormat("unsigned byte", "B", "uint", 1),
+        FITSFormat("16-bit integer", "I", "int", 2),
+        FITSFormat("32-bit integer", "J", "int", 4),
+        FITSFormat("64-bit integer", "K", "int", 8),
+        FITSFormat("character", "A", "bytes", 1),
+        FITSFormat("single precision floating point", "E", "float", 4),
+        FITSFormat("double precision floating point", "D", "float", 8),
+        FITSFormat("single precision complex", "C", "complex", 8),
+        FITSFormat("double precision complex", "M", "complex", 16),
+        # Pair of element count and offset into the heap
+        FITSFormat("array descriptor (32-bit)", "P", "descriptor", 8),
+        FITSFormat("array descriptor (64-bit)", "Q", "descriptor", 16),
+    )
+
+
+class FITSParser(Parser):
+    """TFORM codes of columns, separated by comma e.g. ``1J,10E,20A``.
+
+    Binary tables are always big-endian, so decoded spec starts with ``>`` and byte
+    order given to ``encode`` is ignored.
+
+    """
+
+    framework = "fits"
+    table = FITSTypes
+
+    @classmethod
+    def encode(cls, *spec: Tuple[Specifier, Shape], strategy: str = "exact") -> str:
+        if spec and isinstance(spec[0], str):
+            _, *spec = spec
+
+        formats = [
+            cls.table.search(s.kind, s.byte_size, strategy).with_shape(*shape)
+            for s, shape in spec
+        ]
+        return cls.join(None, formats)
+
+    @classmethod
+    def decode(cls, spec: str) -> List[Union[str, Tuple[Specifier, Shape]]]:
+        endian, tokens = cls.tokenize(spec)
+        return [endian] + [cls.table.find(s) for _, s in tokens]
+
+    @classmethod
+    def tokenize(cls, spec: str) -> Tuple[Optional[str], List[Token]]:
+        return ">", split_tokens(spec)
+
+
+def open_bintable(
+    filename: str, tform: str, offset: int = 0, nrows: Optional[int] = None
+) -> Any:
+    """Memory-map data block of a binary table as NumPy structured array.
+
+    Columns can be accessed by ``f0``, ``f1``, ..., without reading whole table.
+
+    Parameters
+    ----------
+    filename
+        Path to the FITS file.
+    tform
+        Comma separated TFORM codes of the columns, in order of TFORMn keywords.
+    offset
+        Position of the data block in bytes, i.e. end of the extension header.
+    nrows
+        Number of rows (NAXIS2). If omitted, the rest of the file is mapped, which
+        only works if the table ends the file without heap nor padding. Data blocks
+        of FITS files are padded to multiples of 2880 bytes, so pass it for them.
+
+    Notes
+    -----
+    Logical (``L``) columns are mapped to ``S1``, holding ``b"T"``, ``b"F"`` or
+    ``b"\\x00"`` if undefined; compare with ``b"T"`` to get booleans. Bit (``X``)
+    columns are mapped to ``u1`` of as many bytes as the bits take, to be unpacked
+    by ``numpy.unpackbits``. Array descriptors (``P``, ``Q``) are mapped to pairs of
+    element count and offset into the heap, which isn't mapped.
+
+    """
+    import numpy as np
+
+    from .numpy import NumPyParser, NumPyTypes
+
+    endian, *fields = FITSParser.decode(tform)
+    formats = []
+    for specifier, shape in fields:
+        if specifier.kind == "logical":
+            specifier, shape = NumPyTypes.find("S1")[0], (1, *shape)
+        elif specifier.kind == "bit":
+            bits = reduce(mul, shape, 1)
+            specifier, shape = NumPyTypes.find("u1")[0], ((bits + 7) // 8,)
+        elif specifier.kind == "descriptor":
+            pair = "i4" if specifier.character == "P" else "i8"
+            specifier, shape = NumPyTypes.find(pair)[0], (*shape, 2)
+        try:
+            formats.append(NumPyParser.encode(endian, (specifier, shape)))
+        except StopIteration:
+            raise ValueError(f"Column {specifier.character} has no NumPy dtype")
+    dtype = np.dtype(",".join(formats))
+    return np.memmap(filename, dtype=dtype, mode="r", offset=offset, shape=nrows)
@@ -2,12 +2,25 @@
 
 import ctypes
 import re
-from typing import List, Optional, Tuple, Union
+import sys
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 
-from ..core import Parser, Specifier, Types
+from ..core import Field, Parser, Record, Specifier, Types
+from ..core.parser import Token
 from ..typing import Shape
 
 
+# Byte order mark may precede the shape of subarray, or follow it as in "(2,3)<i2"
+FIELD = re.compile(
+    r"(?P<mark>[=<>|]?)\s*(?P<shape>\([\d,\s]*\))?\s*(?P<inner>[=<>|]?)\s*"
+    r"(?P<code>[\d\s]*[a-zA-Z\?]\d*)"
+)
+
+
+def _native(endian: str) -> str:
+    return {"=": "<" if sys.byteorder == "little" else ">"}.get(endian, endian)
+
+
 class NumPyFormat(Specifier):
 
     framework = "numpy"
@@ -38,7 +51,7 @@ class NumPyFormat(Specifier):
             length = int(length) if length else 1
             if parsed[0][0] == "":
                 return (int(length),)
-            return tuple(map(int, [length, *shape.split(",")]))
+            return _shape(length, *shape.split(","))
         else:
             match_str = rf"^\(?([\d,\s]*)\)?\s*{re.escape(self.character)}$"
             parsed = re.findall(match_str, spec)
@@ -47,7 +60,14 @@ class NumPyFormat(Specifier):
                 return
             if parsed[0] == "":
                 return tuple()
-            return tuple(map(int, parsed[0].split(",")))
+            return _shape(*parsed[0].split(","))
+
+
+def _shape(*dims: Union[int, str]) -> Optional[Shape]:
+    # Malformed shape such as "(3,,4)" matches no type
+    if not all(str(d).strip().isdigit() for d in dims):
+        return
+    return tuple(map(int, dims))
 
 
 class NumPyTypes(Types):
@@ -76,11 +96,12 @@ class NumPyTypes(Types):
         NumPyFormat("timedelta", "m8", "timedelta", 8),
         NumPyFormat("datetime", "M", "datetime", 8),
         NumPyFormat("datetime", "M8", "datetime", 8),
-        NumPyFormat("object", "O", None, None),
+        NumPyFormat("object", "O", "object", None),
         NumPyFormat("string", "S", "bytes", 1),
         NumPyFormat("string", "a", "bytes", 1),
-        NumPyFormat("unicode", "U", "str", 1),
-        NumPyFormat("void", "V", None, None),
+        # UCS4, so 4 bytes per character
+        NumPyFormat("unicode", "U", "str", 4),
+        NumPyFormat("void", "V", "void", None),
         # ctypes dtypes
         NumPyFormat("c_short", "h", "int", ctypes.sizeof(ctypes.c_short)),
         NumPyFormat("c_ushort", "H", "uint", ctypes.sizeof(ctypes.c_ushort)),
@@ -97,32 +118,171 @@ class NumPyTypes(Types):
         NumPyFormat("P", "P", "uint", 8),
         NumPyFormat("bool", "b1", "bool", 1),
     )
+    native = {
+        **dict.fromkeys("hH", "short"),
+        **dict.fromkeys("iI", "int"),
+        **dict.fromkeys("lL", "long"),
+        "g": "long_double",
+        **dict.fromkeys("pP", "pointer"),
+    }
 
 
 class NumPyParser(Parser):
 
     framework = "numpy"
+    table = NumPyTypes
 
     @classmethod
     def encode(cls, *spec, strategy: str = "exact") -> str:
-        endian = ""
-        if isinstance(spec[0], str):
+        endian = None
+        if spec and isinstance(spec[0], str):
             endian, *spec = spec
 
         formats = [
-            NumPyTypes.search(s.kind, s.byte_size, strategy).with_shape(*shape)
+            cls.table.search(s.kind, s.byte_size, strategy).with_shape(*shape)
             for s, shape in spec
         ]
-        return endian + ",".join(formats)
+        return cls.join(endian, formats)
+
+    @classmethod
+    def join(cls, endian: Optional[str], formats: List[str]) -> str:
+        endian = {"@": "=", "!": ">"}.get(endian, endian or "")
+        # Byte order only applies to the field it prefixes.
+        return ",".join(endian + f for f in formats)
 
     @classmethod
     def decode(cls, spec: str) -> List[Union[str, Tuple[Specifier, Shape]]]:
-        split = re.findall(r"\([\d,\s]*\)\s*[a-zA-Z\?]\d*|[\d\s]*[a-zA-Z\?]\d*", spec)
-        endian = None
-        if split[0] in "=<>|":
-            endian, *split = split
-        specs = [NumPyTypes.find(s) for s in split]
+        endian, tokens = cls.tokenize(spec)
+        if any(s in "=<>" for _, s in tokens):
+            raise ValueError(f"Mixed byte order in {spec} isn't supported")
+        specs = [cls.table.find(s) for _, s in tokens]
 
         if endian is None:
             return specs
         return [endian] + specs
+
+    @classmethod
+    def tokenize(cls, spec: str) -> Tuple[Optional[str], List[Token]]:
+        """Byte order mark applies only to the field it prefixes, as in NumPy.
+
+        Fields without the mark are native. Fields of other byte order than the
+        first mark are returned as tokens of the byte order.
+
+        """
+        fields, marks, conflicts = [], [], []
+        for m in FIELD.finditer(spec):
+            code = m["code"].lstrip()
+            position = m.start("shape") if m["shape"] else m.end("code") - len(code)
+            fields.append((position, (m["shape"] or "") + code.rstrip()))
+            mark = "mark" if m["mark"] else "inner"
+            marks.append((m.start(mark), m[mark]))
+            if m["mark"] and m["inner"] and (m["mark"] != m["inner"]):
+                # Both sides of the shape marked, inconsistently
+                conflicts.append((m.start("inner"), m["inner"]))
+
+        orders = [(p, mark) for p, mark in marks if mark in "=<>" and mark]
+        endian = orders[0][1] if orders else ("|" if "|" in spec else None)
+        if endian not in ("<", ">", "="):
+            return endian, sorted(fields + conflicts)
+
+        conflicts += [(p, o) for p, o in orders if _native(o) != _native(endian)]
+        if _native(endian) != _native("="):
+            # Unmarked fields are native, which only matters for multi-byte ones
+            for (position, field), (_, mark) in zip(fields, marks):
+                found = cls.table.lookup(field) if mark in ("", "|") else None
+                if (found is not None) and ((found[0].byte_size or 0) > 1):
+                    conflicts.append((position, "="))
+        return endian, sorted(fields + conflicts)
+
+    @classmethod
+    def decode_record(cls, spec: Union[str, Sequence[Any], Dict[str, Any]]) -> Record:
+        """Decode structured dtype, in comma separated, list or dict form.
+
+        Fields of comma separated form are named ``f0``, ``f1``, ... as NumPy does.
+
+        Examples
+        --------
+        >>> NumPyParser.decode_record([("time", "<f8"), ("pos", [("x", "<f4")], (3,))])
+        >>> NumPyParser.decode_record(
+        ...     {"names": ["a", "b"], "formats": ["u1", "<i4"], "offsets": [0, 4]}
+        ... )
+
+        """
+        if isinstance(spec, str):
+            return _pack(cls.decode(spec))
+        if not isinstance(spec, dict):
+            return Record.packed(*(_decode_field(*field) for field in spec))
+
+        fields = [_decode_field(*f) for f in zip(spec["names"], spec["formats"])]
+        if "offsets" not in spec:
+            return Record.packed(*fields)
+        fields = [
+            Field(name, offset, specifier, shape, endian)
+            for (name, specifier, shape, endian), offset in zip(fields, spec["offsets"])
+        ]
+        itemsize = max((f.offset + f.itemsize for f in fields), default=0)
+        return Record(tuple(fields), spec.get("itemsize", itemsize))
+
+    @classmethod
+    def encode_record(
+        cls, record: Record, form: str = "list", strategy: str = "exact"
+    ) -> Union[List[Tuple[Any, ...]], Dict[str, Any]]:
+        """Encode to list form ``[(name, format), ...]`` or dict form.
+
+        List form cannot express padding, so records with gaps between or after the
+        fields need ``form="dict"``.
+
+        """
+        form = form.lower()
+        if form not in ("list", "dict"):
+            raise ValueError(f"Unknown form {form!r}")
+        if (form == "list") and (not record.is_packed):
+            raise ValueError("Record with padding can only be encoded in dict form")
+
+        formats = []
+        for field in record.fields:
+            if isinstance(field.specifier, Record):
+                fmt = cls.encode_record(field.specifier, form, strategy)
+                formats.append((fmt, tuple(field.shape)) if field.shape else fmt)
+            else:
+                s = field.specifier
+                fmt = cls.table.search(s.kind, s.byte_size, strategy)
+                formats.append((field.endian or "") + fmt.with_shape(*field.shape))
+
+        if form == "list":
+            return [(f.name, fmt) for f, fmt in zip(record.fields, formats)]
+        return {
+            "names": [f.name for f in record.fields],
+            "formats": formats,
+            "offsets": [f.offset for f in record.fields],
+            "itemsize": record.itemsize,
+        }
+
+
+def _pack(decoded: List[Union[str, Tuple[Specifier, Shape]]]) -> Record:
+    endian = None
+    if isinstance(decoded[0], str):
+        endian, *decoded = decoded
+    fields = [(f"f{i}", s, shape, endian) for i, (s, shape) in enumerate(decoded)]
+    return Record.packed(*fields)
+
+
+def _decode_field(
+    name: str, fmt: Any, shape: Union[int, Shape] = ()
+) -> Tuple[str, Union[Specifier, Record], Shape, Optional[str]]:
+    if isinstance(fmt, tuple):
+        fmt, shape = fmt
+    shape = (shape,) if isinstance(shape, int) else tuple(shape)
+    if not isinstance(fmt, str):
+        return name, NumPyParser.decode_record(fmt), shape, None
+
+    decoded = NumPyParser.decode(fmt)
+    if len([s for s in decoded if not isinstance(s, str)]) > 1:
+        return name, _pack(decoded), shape, None
+
+    endian = decoded[0] if isinstance(decoded[0], str) else None
+    specifier, _shape = decoded[-1]
+    if specifier.kind in ("bytes", "str"):
+        # First dimension is the length of string
+        return name, specifier, (_shape[0], *shape, *_shape[1:]), endian
+    return name, specifier, (*shape, *_shape), endian
@@ -1,20 +1,38 @@
 """Format characters in struct, Python standard library."""
 
 import re
-from typing import List, Optional, Tuple, Union
+import sys
+from functools import reduce
+from operator import mul
+from typing import Iterator, List, Optional, Set, Tuple, Type, Union
 
-from ..core import Parser, Specifier, Types
+from ..core import Parser, Record, Specifier, Types
+from ..core.parser import Token
 from ..typing import Shape
 
+NATIVE_ORDER = "<" if sys.byteorder == "little" else ">"
+
 
 class StructFormat(Specifier):
 
     framework = "struct"
     reference = "https://docs.python.org/3/library/struct.html#format-characters"
 
-    def with_shape(self, *shape: int) -> str:
+    def with_shape(self, *shape: int, flatten: bool = False) -> str:
+        """Return a format for array.
+
+        Parameters
+        ----------
+        flatten
+            If True, multi-dimensional arrays are written as a single count of all
+            elements, and arrays of strings are compacted into one string. The
+            original shape can be restored by reshaping unpacked values.
+
+        """
         if len(shape) == 0:
             return self.character
+        if flatten:
+            return f"{reduce(mul, shape, 1)}{self.character}"
         if "s" in self.character:
             if len(shape) > 2:
                 raise ValueError(
@@ -43,7 +61,7 @@ class StructTypes(Types):
 
     framework = "struct"
     types = (
-        StructFormat("pad byte", "x", None, None),
+        StructFormat("pad byte", "x", "pad", 1),
         StructFormat("char", "c", "char", 1),
         StructFormat("signed char", "b", "int", 1),
         StructFormat("unsigned char", "B", "uint", 1),
@@ -65,32 +83,147 @@ class StructTypes(Types):
         StructFormat("char[]", "p", "bytes", None),
         StructFormat("void", "P", "int", None),
     )
+    native = {
+        **dict.fromkeys("hH", "short"),
+        **dict.fromkeys("iI", "int"),
+        **dict.fromkeys("lL", "long"),
+        **dict.fromkeys("qQ", "long_long"),
+        **dict.fromkeys("nN", "size_t"),
+        "P": "pointer",
+    }
 
 
 class StructParser(Parser):
 
     framework = "struct"
+    table = StructTypes
 
     @classmethod
-    def encode(cls, *spec: Tuple[Specifier, Shape], strategy: str = "exact") -> str:
-        endian = ""
-        if isinstance(spec[0], str):
+    def encode(
+        cls,
+        *spec: Tuple[Specifier, Shape],
+        strategy: str = "exact",
+        flatten: bool = False,
+    ) -> str:
+        endian = None
+        if spec and isinstance(spec[0], str):
             endian, *spec = spec
 
+        table = cls._table(endian)
         formats = [
-            StructTypes.search(s.kind, s.byte_size, strategy).with_shape(*shape)
+            table.search(s.kind, s.byte_size, strategy).with_shape(
+                *shape, flatten=flatten
+            )
             for s, shape in spec
         ]
-        return endian + "".join(formats)
+        return cls.join(endian, formats)
+
+    @classmethod
+    def join(cls, endian: Optional[str], formats: List[str]) -> str:
+        return {"|": "="}.get(endian, endian or "") + "".join(formats)
+
+    @classmethod
+    def aligned(cls, decoded: List[Union[str, Tuple[Specifier, Shape]]]) -> bool:
+        endian = decoded[0] if decoded and isinstance(decoded[0], str) else "@"
+        return endian == "@"
+
+    @classmethod
+    def encode_flat(
+        cls, *spec: Tuple[Specifier, Shape], strategy: str = "exact"
+    ) -> Tuple[str, List[Shape]]:
+        """Encode with arrays flattened, returning original shape of each field.
+
+        Shapes are of the array, without the length of strings. An array of strings
+        is merged into one string, which unpacks as a single value; split it into
+        items of their length before reshaping, e.g. by ``numpy.frombuffer``.
+
+        Examples
+        --------
+        >>> fmt, shapes = StructParser.encode_flat(*NumPyParser.decode("(64,64)f4"))
+        >>> fmt, shapes
+        ('4096f', [(64, 64)])
+        >>> numpy.frombuffer(data, "f4").reshape(shapes[0])
+        >>> fmt, shapes = StructParser.encode_flat(*NumPyParser.decode("(3,4)S8"))
+        >>> fmt, shapes
+        ('96s', [(3, 4)])
+        >>> numpy.frombuffer(struct.unpack(fmt, data)[0], "S8").reshape(shapes[0])
+
+        """
+        shapes = [
+            tuple(shape[1:] if s.kind in ("bytes", "str") else shape)
+            for s, shape in (s for s in spec if not isinstance(s, str))
+        ]
+        return cls.encode(*spec, strategy=strategy, flatten=True), shapes
 
     @classmethod
     def decode(cls, spec: str) -> List[Union[str, Tuple[Specifier, Shape]]]:
-        split = re.findall(r"([@=<>!]+|\d*[a-zA-Z\?])", spec)
-        endian = None
-        if split[0] in "@=<>!":
-            endian, *split = split
-        specs = [StructTypes.find(s) for s in split]
+        endian, tokens = cls.tokenize(spec)
+        specs = [cls._table(endian).find(s) for _, s in tokens]
 
         if endian is None:
             return specs
         return [endian] + specs
+
+    @classmethod
+    def _table(cls, endian: Optional[str]) -> Type[Types]:
+        # ABI only sizes native mode; sizes in standard mode are fixed
+        return cls.table if endian in (None, "@") else StructTypes
+
+    @classmethod
+    def tokenize(cls, spec: str) -> Tuple[Optional[str], List[Token]]:
+        split = re.finditer(r"[@=<>!]+|\d*[a-zA-Z\?]", spec)
+        tokens = [(m.start(), m[0]) for m in split]
+        # Byte order is only allowed at the beginning
+        if tokens and tokens[0][1] in "@=<>!":
+            return tokens[0][1], tokens[1:]
+        return None, tokens
+
+    @classmethod
+    def encode_record(
+        cls, record: Record, strategy: str = "exact", flatten: bool = False
+    ) -> str:
+        """Flatten nested fields into a format, filling gaps with pad bytes ``x``.
+
+        Field names are dropped. Formats are in standard size and alignment, so
+        offsets are kept exactly as given. Multi-dimensional arrays need
+        ``flatten``, as in :meth:`StructFormat.with_shape`.
+
+        Fields without byte order are native, as in NumPy. Multi-byte fields of
+        different byte orders cannot share a format and raise ValueError.
+
+        """
+        endians: Set[str] = set()
+        formats = list(_flatten(record, strategy, flatten, endians))
+        orders = {NATIVE_ORDER if e == "=" else e for e in endians}
+        if len(orders) > 1:
+            raise ValueError(f"Mixed byte order {orders} isn't supported")
+        # Keep the mark as given, unless every field is native
+        endian = (endians - {"="}).pop() if endians - {"="} else "="
+        return endian + "".join(formats)
+
+
+def _flatten(
+    record: Record, strategy: str, flatten: bool, endians: Set[str]
+) -> Iterator[str]:
+    position = 0
+    for field in sorted(record.fields, key=lambda f: f.offset):
+        if field.offset < position:
+            raise ValueError(f"Field {field.name!r} overlaps with preceding one")
+        if field.offset > position:
+            yield f"{field.offset - position}x"
+
+        if isinstance(field.specifier, Record):
+            inner = "".join(_flatten(field.specifier, strategy, flatten, endians))
+            yield inner * reduce(mul, field.shape, 1)
+        else:
+            s = field.specifier
+            if (s.byte_size or 0) > 1:
+                # Byte order of single bytes doesn't matter
+                endian = field.endian or "="
+                endians.add({"@": "=", "!": ">", "|": "="}.get(endian, endian))
+            fmt = StructTypes.search(s.kind, s.byte_size, strategy)
+            yield fmt.with_shape(*field.shape, flatten=flatten)
+        position = field.offset + field.itemsize
+
+    if record.itemsize > position:
+        yield f"{record.itemsize - position}x"
@@ -0,0 +1,181 @@
+"""Infer the narrowest lossless specifier of data."""
+
+import math
+import struct
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, List, Optional, Sequence, Tuple, Union
+
+from .core import Specifier
+from .translator import framework
+from .typing import Shape
+
+CHUNK_SIZE = 1 << 20
+
+
+class InferredFormat(Specifier):
+    """Kind and size found in data, to be searched in the target framework."""
+
+    framework = "inferred"
+    reference = ""
+
+    def with_shape(self, *shape: int) -> str:
+        raise NotImplementedError
+
+    def ident(self, spec: str) -> None:
+        return
+
+
+def infer(
+    data: Any,
+    to: str = "numpy",
+    chunk_size: int = CHUNK_SIZE,
+    workers: Optional[int] = None,
+) -> str:
+    """Return the smallest specifier that stores every value of data without loss.
+
+    Parameters
+    ----------
+    data
+        NumPy array (each field of structured array is a column), dict of columns,
+        buffer such as ``array.array``, or sequence of values. Axes of NumPy array
+        after the first are the shape of subarray in each record.
+    to
+        Framework of the specifier.
+    chunk_size
+        NumPy arrays longer than this are scanned chunk by chunk in parallel.
+    workers
+        Number of threads scanning the chunks.
+
+    Examples
+    --------
+    >>> infer({"count": [0, 300], "ratio": [0.5, 0.25], "name": [b"a", b"abc"]})
+    'u2,f2,S3'
+
+    """
+    columns = _columns(data)
+    if len(columns) == 0:
+        raise ValueError("No column to infer specifier of")
+    spec = [_infer_column(c, chunk_size, workers) for c in columns]
+    try:
+        return framework[to.lower()].encode(*spec, strategy="contain")
+    except StopIteration:
+        raise ValueError(f"No type in {to} can hold the data")
+
+
+def _columns(data: Any) -> List[Any]:
+    if isinstance(data, dict):
+        return list(data.values())
+    if type(data).__module__ == "numpy" and data.dtype.names is not None:
+        return [data[name] for name in data.dtype.names]
+    if isinstance(data, (bytes, bytearray)):
+        return [memoryview(data)]
+    return [data]
+
+
+def _infer_column(
+    column: Any, chunk_size: int, workers: Optional[int]
+) -> Tuple[InferredFormat, Shape]:
+    if type(column).__module__ == "numpy" and column.dtype.kind != "O":
+        specifier, shape = _infer_numpy(column.reshape(-1), chunk_size, workers)
+        # Length of string, if any, comes first as in decoded specs
+        return specifier, (*shape, *column.shape[1:])
+    values = memoryview(column).tolist() if _is_buffer(column) else list(column)
+    if len(values) == 0:
+        raise ValueError("Cannot infer specifier of empty column")
+    return _infer_values(values)
+
+
+def _is_buffer(column: Any) -> bool:
+    try:
+        memoryview(column)
+    except TypeError:
+        return False
+    return True
+
+
+def _spec(kind: str, byte_size: int, shape: Shape = ()) -> Tuple[InferredFormat, Shape]:
+    return InferredFormat(kind, "", kind, byte_size), shape
+
+
+def _integer_size(lo: int, hi: int) -> Tuple[str, int]:
+    if lo >= 0:
+        return "uint", max((hi.bit_length() + 7) // 8, 1)
+    # Two's complement of n bits holds -2**(n-1) to 2**(n-1)-1
+    bits = max((v if v >= 0 else ~v).bit_length() for v in (lo, hi)) + 1
+    return "int", (bits + 7) // 8
+
+
+def _float_size(values: Sequence[Union[int, float]]) -> int:
+    # Integers are compared exactly, so ones a float rounds are detected too
+    for size, fmt in [(2, "e"), (4, "f"), (8, "d")]:
+        try:
+            if all(
+                (struct.unpack(fmt, struct.pack(fmt, v))[0] == v) or math.isnan(v)
+                for v in values
+            ):
+                return size
+        except (OverflowError, struct.error):
+            pass
+    raise ValueError("Cannot store the values in a float without loss")
+
+
+def _infer_values(values: List[Any]) -> Tuple[InferredFormat, Shape]:
+    if all(isinstance(v, bool) for v in values):
+        return _spec("bool", 1)
+    if all(isinstance(v, int) for v in values):
+        return _spec(*_integer_size(min(values), max(values)))
+    if all(isinstance(v, (int, float)) for v in values):
+        return _spec("float", _float_size(values))
+    # Zero length isn't a valid string type, as in NumPy
+    if all(isinstance(v, bytes) for v in values):
+        return _spec("bytes", 1, (max(max(map(len, values)), 1),))
+    if all(isinstance(v, str) for v in values):
+        return _spec("str", 4, (max(max(map(len, values)), 1),))
+    raise ValueError(f"Cannot infer specifier of {type(values[0]).__name__} values")
+
+
+def _map_chunks(
+    func: Callable[[Any], Any], array: Any, chunk_size: int, workers: Optional[int]
+) -> List[Any]:
+    chunks = [array[i : i + chunk_size] for i in range(0, len(array), chunk_size)]
+    if len(chunks) < 2:
+        return [func(c) for c in chunks]
+    # NumPy releases GIL in reductions, so threads scan chunks in parallel
+    with ThreadPoolExecutor(workers) as executor:
+        return list(executor.map(func, chunks))
+
+
+def _infer_numpy(
+    array: Any, chunk_size: int, workers: Optional[int]
+) -> Tuple[InferredFormat, Shape]:
+    import numpy as np
+
+    if array.size == 0:
+        raise ValueError("Cannot infer specifier of empty column")
+    kind = array.dtype.kind
+    if kind == "b":
+        return _spec("bool", 1)
+    if kind in "iu":
+        ranges = _map_chunks(lambda c: (c.min(), c.max()), array, chunk_size, workers)
+        lo, hi = min(int(r[0]) for r in ranges), max(int(r[1]) for r in ranges)
+        return _spec(*_integer_size(lo, hi))
+    if kind == "f":
+
+        def size(chunk: Any) -> int:
+            with np.errstate(over="ignore"):
+                for candidate in (np.float16, np.float32, np.float64):
+                    if array.dtype.itemsize <= np.dtype(candidate).itemsize:
+                        return array.dtype.itemsize
+                    cast = chunk.astype(candidate).astype(chunk.dtype)
+                    if np.array_equal(cast, chunk, equal_nan=True):
+                        return np.dtype(candidate).itemsize
+            return array.dtype.itemsize
+
+        return _spec("float", max(_map_chunks(size, array, chunk_size, workers)))
+    if kind in "SU":
+        lengths = _map_chunks(
+            lambda c: int(np.char.str_len(c).max()), array, chunk_size, workers
+        )
+        length = (max(max(lengths), 1),)
+        return _spec("bytes", 1, length) if kind == "S" else _spec("str", 4, length)
+    raise ValueError(f"Cannot infer specifier of dtype {array.dtype}")
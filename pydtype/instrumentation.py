@@ -0,0 +1,225 @@
+"""Opt-in timing and counters of translation stages.
+
+Nothing is measured unless :func:`enable` is called or :func:`profile` is active.
+Functions measured are replaced by timing wrappers only while enabled, so when
+disabled the cost is a check of module-level flag per translation.
+
+Stages are ``translate``, ``decode``, ``encode``, ``find`` (``Types.find``) and
+``match``. They're nested, i.e. time of ``find`` is also included in ``decode``,
+which is included in ``translate``.
+
+Examples
+--------
+>>> with instrumentation.profile() as stats:
+...     pydtype.translate("<i4,(3,)f8", "numpy", "struct")
+>>> stats.snapshot()["stages"]["decode"]["count"]
+1
+
+"""
+
+import heapq
+import sys
+import threading
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from functools import wraps
+from time import perf_counter
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+Hook = Callable[[str, float, Dict[str, Any]], None]
+
+enabled = False
+# Replaced as a whole on (un)registration, so readers need no lock
+_hooks: Tuple[Hook, ...] = ()
+_hooks_lock = threading.Lock()
+# Enabled by ``enable``, and number of active ``profile`` blocks
+_state = {"enabled": False, "profiles": 0}
+_state_lock = threading.Lock()
+# Functions decorated by ``timed``, with their timing wrappers
+_timed: List[Tuple[Callable, Callable]] = []
+
+
+def enable() -> None:
+    with _state_lock:
+        _state["enabled"] = True
+        _update()
+
+
+def disable() -> None:
+    """Stop measuring, unless a :func:`profile` block is still active."""
+    with _state_lock:
+        _state["enabled"] = False
+        _update()
+
+
+def _update() -> None:
+    global enabled
+    on = _state["enabled"] or (_state["profiles"] > 0)
+    if on != enabled:
+        for func, wrapper in _timed:
+            _swap(func, wrapper if on else func)
+        enabled = on
+
+
+def _swap(func: Callable, replacement: Callable) -> None:
+    # Rebind the name the function is defined as, in its module or class
+    owner = sys.modules[func.__module__]
+    *path, name = func.__qualname__.split(".")
+    for attr in path:
+        owner = getattr(owner, attr)
+    descriptor = type(vars(owner)[name])
+    if descriptor in (classmethod, staticmethod):
+        replacement = descriptor(replacement)
+    setattr(owner, name, replacement)
+
+
+def register(hook: Hook) -> Hook:
+    """Call ``hook(stage, elapsed_seconds, info)`` on every measurement.
+
+    ``info`` of ``translate``, ``decode`` and ``encode`` stages contains ``spec``,
+    ``from_``, ``to`` and ``strategy``. Can be used as a decorator.
+
+    """
+    global _hooks
+    with _hooks_lock:
+        _hooks = (*_hooks, hook)
+    return hook
+
+
+def unregister(hook: Hook) -> None:
+    global _hooks
+    with _hooks_lock:
+        hooks = list(_hooks)
+        hooks.remove(hook)
+        _hooks = tuple(hooks)
+
+
+def record(stage: str, elapsed: float, **info: Any) -> None:
+    for hook in _hooks:
+        hook(stage, elapsed, info)
+
+
+class timer:
+    """Measure a block of code as ``stage``."""
+
+    __slots__ = ("stage", "info", "start")
+
+    def __init__(self, stage: str, **info: Any) -> None:
+        self.stage, self.info = stage, info
+
+    def __enter__(self) -> "timer":
+        self.start = perf_counter()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        record(self.stage, perf_counter() - self.start, **self.info)
+
+
+def timed(stage: str) -> Callable[[Callable], Callable]:
+    """Decorate a function to be measured as ``stage`` while enabled.
+
+    The function is returned as is, and swapped with a timing wrapper while
+    enabled. It must be defined in a module or a class, not in a function; methods
+    are decorated below ``classmethod`` or ``staticmethod``.
+
+    """
+
+    def decorator(func: Callable) -> Callable:
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            start = perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                record(stage, perf_counter() - start)
+
+        _timed.append((func, wrapper))
+        return func
+
+    return decorator
+
+
+class Statistics:
+    """Hook aggregating measurements.
+
+    Latency histograms are bucketed by powers of 2 in microseconds; key ``n`` counts
+    measurements shorter than ``2**n`` microseconds.
+
+    """
+
+    def __init__(self, slowest: int = 10) -> None:
+        self.n_slowest = slowest
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.stages: Dict[str, List[float]] = {}
+            self.frameworks: Dict[str, Counter] = defaultdict(Counter)
+            self.strategies: Dict[str, Counter] = defaultdict(Counter)
+            self.slowest: List[Tuple[float, str, str, str]] = []
+
+    def __call__(self, stage: str, elapsed: float, info: Dict[str, Any]) -> None:
+        with self._lock:
+            count, total, longest = self.stages.get(stage, (0, 0.0, 0.0))
+            self.stages[stage] = [count + 1, total + elapsed, max(longest, elapsed)]
+            if stage != "translate":
+                return
+
+            bucket = max(int(elapsed * 1e6), 0).bit_length()
+            self.frameworks[f"{info['from_']}->{info['to']}"][bucket] += 1
+            self.strategies[info["strategy"]][bucket] += 1
+            item = (elapsed, info["spec"], info["from_"], info["to"])
+            if len(self.slowest) < self.n_slowest:
+                heapq.heappush(self.slowest, item)
+            else:
+                heapq.heappushpop(self.slowest, item)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return plain dict of current values, for export to metrics systems."""
+        with self._lock:
+            return {
+                "stages": {
+                    stage: {"count": count, "total": total, "max": longest}
+                    for stage, (count, total, longest) in self.stages.items()
+                },
+                "frameworks": {k: dict(v) for k, v in self.frameworks.items()},
+                "strategies": {k: dict(v) for k, v in self.strategies.items()},
+                "slowest": [
+                    {"spec": spec, "from_": from_, "to": to, "elapsed": elapsed}
+                    for elapsed, spec, from_, to in sorted(self.slowest, reverse=True)
+                ],
+            }
+
+
+statistics = register(Statistics())
+
+
+def snapshot() -> Dict[str, Any]:
+    """Snapshot of the default statistics collected since the last reset."""
+    return statistics.snapshot()
+
+
+@contextmanager
+def profile(hook: Optional[Statistics] = None) -> Iterator[Statistics]:
+    """Collect statistics only of the enclosed block of code.
+
+    Notes
+    -----
+    Instrumentation is switched on process-wide while the block runs, so
+    translations in other threads are also collected. It's switched off when the
+    last of blocks running at once exits, unless :func:`enable` was called.
+
+    """
+    hook = Statistics() if hook is None else hook
+    register(hook)
+    with _state_lock:
+        _state["profiles"] += 1
+        _update()
+    try:
+        yield hook
+    finally:
+        with _state_lock:
+            _state["profiles"] -= 1
+            _update()
+        unregister(hook)
@@ -0,0 +1,193 @@
+"""Pack many records into bytes through a translated layout."""
+
+import struct
+from functools import lru_cache
+from itertools import chain, islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Union
+
+from .core.record import layout
+from .frameworks import NumPyParser
+from .translator import framework, translate
+
+Records = Union[Iterable[Sequence[Any]], Dict[str, Sequence[Any]], Any]
+
+
+ENDIANS = ("@", "=", "<", ">", "!")
+
+
+@lru_cache(maxsize=None)
+def compile_struct(spec: str, from_: str) -> struct.Struct:
+    """Return cached ``struct.Struct`` of a spec, laid out as the spec is."""
+    parser = framework[from_]
+    fmt = translate(spec, from_, "struct")
+    # Format without byte order is aligned, while the spec may be packed
+    if (fmt[:1] not in ENDIANS) and not parser.aligned(parser.decode(spec)):
+        fmt = "=" + fmt
+    return struct.Struct(fmt)
+
+
+@lru_cache(maxsize=256)
+def _compile_many(spec: str, from_: str, count: int) -> Optional[struct.Struct]:
+    # Packing a chunk of records by single call is much faster than packing each.
+    fmt = compile_struct(spec, from_).format
+    endian = fmt[0] if fmt[:1] in ENDIANS else ""
+    many = struct.Struct(endian + fmt[len(endian) :] * count)
+    # Native alignment may differ between repeated format and repeated records
+    return many if many.size == compile_struct(spec, from_).size * count else None
+
+
+@lru_cache(maxsize=None)
+def compile_dtype(spec: str, from_: str) -> Any:
+    """Return cached NumPy structured dtype of a spec, with padding of the spec."""
+    import numpy as np
+
+    parser = framework[from_]
+    decoded = parser.decode(spec)
+    endian = [decoded[0]] if isinstance(decoded[0], str) else []
+    fields = decoded[len(endian) :]
+    offsets, itemsize = layout(*fields, aligned=parser.aligned(decoded))
+    # Pad bytes take no values, as in struct, so they're left out of the names
+    values = [(f, o) for f, o in zip(fields, offsets) if f[0].kind != "pad"]
+    return np.dtype(
+        {
+            "names": [f"f{i}" for i in range(len(values))],
+            "formats": [NumPyParser.encode(*endian, f) for f, _ in values],
+            "offsets": [o for _, o in values],
+            "itemsize": itemsize,
+        }
+    )
+
+
+def pack_records(
+    records: Records,
+    spec: str,
+    from_: str,
+    out: Optional[Any] = None,
+    file: Optional[Any] = None,
+    chunk_size: int = 4096,
+) -> Union[bytearray, memoryview, int]:
+    """Pack records into the layout of a spec.
+
+    Parameters
+    ----------
+    records
+        Sequence (or iterable, when writing to ``file``) of tuples in the order of
+        struct values, i.e. array fields are flattened; dict of columns, assigned to
+        the fields in order; or NumPy structured array.
+    spec
+        Specifier of a record.
+    from_
+        Framework of the ``spec``.
+    out
+        Writable buffer to pack into. If omitted, a new bytearray is allocated.
+    file
+        Binary file object to write to, ``chunk_size`` records at a time.
+    chunk_size
+        Number of records packed by one call.
+
+    Returns
+    -------
+    The new bytearray, view of ``out`` that's filled, or number of bytes written to
+    ``file``.
+
+    Notes
+    -----
+    Dict of columns and NumPy arrays are copied through NumPy structured dtype when
+    NumPy is installed; otherwise records are packed by cached ``struct.Struct``.
+
+    """
+    from_ = from_.lower()
+    if _use_numpy(records):
+        return _pack_numpy(records, compile_dtype(spec, from_), out, file, chunk_size)
+    if isinstance(records, dict):
+        records = zip(*records.values())
+
+    size = compile_struct(spec, from_).size
+    if file is not None:
+        buffer, written = bytearray(chunk_size * size), 0
+        for chunk in _chunks(records, chunk_size):
+            n = _pack_into(spec, from_, buffer, 0, chunk)
+            file.write(memoryview(buffer)[:n])
+            written += n
+        return written
+
+    if not isinstance(records, Sequence):
+        records = list(records)
+    buffer = _output(out, len(records) * size)
+    for start in range(0, len(records), chunk_size):
+        chunk = records[start : start + chunk_size]
+        _pack_into(spec, from_, buffer, start * size, chunk)
+    return buffer
+
+
+def _use_numpy(records: Records) -> bool:
+    if not isinstance(records, dict) and (type(records).__module__ != "numpy"):
+        return False
+    try:
+        import numpy  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def _output(out: Optional[Any], nbytes: int) -> Union[bytearray, memoryview]:
+    if out is None:
+        return bytearray(nbytes)
+    view = memoryview(out).cast("B")
+    if view.nbytes < nbytes:
+        raise ValueError(f"Buffer of {view.nbytes} bytes is too small for {nbytes}")
+    return view[:nbytes]
+
+
+def _chunks(records: Iterable[Sequence[Any]], size: int) -> Iterator[List[Any]]:
+    records = iter(records)
+    while True:
+        chunk = list(islice(records, size))
+        if len(chunk) == 0:
+            return
+        yield chunk
+
+
+def _pack_into(
+    spec: str, from_: str, buffer: Any, offset: int, chunk: Sequence[Sequence[Any]]
+) -> int:
+    fmt = compile_struct(spec, from_)
+    many = _compile_many(spec, from_, len(chunk))
+    if many is not None:
+        many.pack_into(buffer, offset, *chain.from_iterable(chunk))
+    else:
+        for i, record in enumerate(chunk):
+            fmt.pack_into(buffer, offset + i * fmt.size, *record)
+    return len(chunk) * fmt.size
+
+
+def _pack_numpy(
+    records: Any, dtype: Any, out: Optional[Any], file: Optional[Any], chunk_size: int
+) -> Union[bytearray, memoryview, int]:
+    import numpy as np
+
+    columns = list(records.values()) if isinstance(records, dict) else None
+    n = len(records) if columns is None else min(map(len, columns), default=0)
+
+    def fill(array: Any, start: int, stop: int) -> None:
+        if columns is None:
+            array[...] = records[start:stop]
+        else:
+            for name, column in zip(dtype.names, columns):
+                array[name] = column[start:stop]
+
+    if file is not None:
+        buffer, written = bytearray(chunk_size * dtype.itemsize), 0
+        for start in range(0, n, chunk_size):
+            stop = min(start + chunk_size, n)
+            fill(np.frombuffer(buffer, dtype, stop - start), start, stop)
+            file.write(memoryview(buffer)[: (stop - start) * dtype.itemsize])
+            written += (stop - start) * dtype.itemsize
+        return written
+
+    buffer = _output(out, n * dtype.itemsize)
+    if out is not None:
+        # Padding is zeroed, as struct does
+        buffer[:] = bytes(len(buffer))
+    fill(np.frombuffer(buffer, dtype, n), 0, n)
+    return buffer
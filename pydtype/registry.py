@@ -0,0 +1,228 @@
+"""Schemas computed once and shared with worker processes.
+
+The parent process adds every schema it needs to a :class:`SchemaRegistry` and
+publishes it into shared memory. Workers attach to it read-only and look schemas up
+by fingerprint of the spec, without decoding or translating anything.
+
+Examples
+--------
+>>> registry = SchemaRegistry()
+>>> registry.add("<i4,(3,)f8", "numpy")
+>>> shm = registry.publish()  # Before forking workers
+>>> # In a worker
+>>> shared = SharedSchemaRegistry.attach(shm.name)
+>>> shared.get("<i4,(3,)f8", "numpy").translations["struct"]
+'<i3d'
+
+"""
+
+import hashlib
+import struct
+from bisect import bisect_left
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple
+
+from .core.record import layout
+from .translator import framework, translate
+
+if TYPE_CHECKING:
+    # Python >= 3.8, so imported where it's used
+    from multiprocessing import shared_memory
+
+MAGIC = b"PDTR"
+VERSION = 1
+# magic, version, number of schemas
+HEADER = struct.Struct("<4sHxxI")
+FINGERPRINT_SIZE = 8
+# fingerprint, position of entry, size of entry
+INDEX = struct.Struct(f"<{FINGERPRINT_SIZE}sII")
+# itemsize, number of fields, number of translations
+ENTRY = struct.Struct("<III")
+LENGTH = struct.Struct("<I")
+
+
+def fingerprint(spec: str, from_: str) -> bytes:
+    key = f"{from_.lower()}\0{spec}".encode()
+    return hashlib.blake2b(key, digest_size=FINGERPRINT_SIZE).digest()
+
+
+@dataclass(frozen=True)
+class Schema:
+
+    spec: str
+    from_: str
+    itemsize: int
+    offsets: Tuple[int, ...]
+    translations: Dict[str, str]
+
+
+class SchemaRegistry:
+    """Mutable registry, to be filled in the parent process."""
+
+    def __init__(self) -> None:
+        self._schemas: Dict[bytes, Schema] = {}
+
+    def __len__(self) -> int:
+        return len(self._schemas)
+
+    def __contains__(self, key: Tuple[str, str]) -> bool:
+        return fingerprint(*key) in self._schemas
+
+    def add(self, spec: str, from_: str, to: Optional[Iterable[str]] = None) -> Schema:
+        """Decode and translate a spec, to all frameworks it's expressible in.
+
+        Specs with fields of unknown size, such as NumPy object, raise ValueError.
+
+        """
+        from_ = from_.lower()
+        decoded = framework[from_].decode(spec)
+        fields = [s for s in decoded if not isinstance(s, str)]
+        offsets, itemsize = layout(*fields, aligned=framework[from_].aligned(decoded))
+
+        translations = {}
+        for target in framework if to is None else to:
+            try:
+                translations[target] = translate(spec, from_, target)
+            except ValueError:
+                pass
+
+        schema = Schema(spec, from_, itemsize, tuple(offsets), translations)
+        self._schemas[fingerprint(spec, from_)] = schema
+        return schema
+
+    def get(self, spec: str, from_: str) -> Schema:
+        return self._schemas[fingerprint(spec, from_)]
+
+    def dumps(self) -> bytes:
+        """Serialize into the binary format read by :class:`SharedSchemaRegistry`."""
+        keys = sorted(self._schemas)
+        entries = [_dump_schema(self._schemas[k]) for k in keys]
+
+        position = HEADER.size + INDEX.size * len(keys)
+        index = []
+        for key, entry in zip(keys, entries):
+            index.append(INDEX.pack(key, position, len(entry)))
+            position += len(entry)
+        return b"".join([HEADER.pack(MAGIC, VERSION, len(keys)), *index, *entries])
+
+    def publish(self, name: Optional[str] = None) -> "shared_memory.SharedMemory":
+        """Copy into a new shared memory block. Requires Python 3.8 or later.
+
+        The caller owns the block, and should ``close`` and ``unlink`` it when the
+        workers are done.
+
+        """
+        from multiprocessing import shared_memory
+
+        data = self.dumps()
+        shm = shared_memory.SharedMemory(name=name, create=True, size=len(data))
+        shm.buf[: len(data)] = data
+        return shm
+
+
+class SharedSchemaRegistry:
+    """Read-only view of a published registry.
+
+    Lookups binary-search the sorted index in place; only the schema looked up is
+    deserialized.
+
+    """
+
+    def __init__(self, buffer) -> None:
+        with memoryview(buffer) as view:
+            if hasattr(view, "toreadonly"):
+                self._buffer = view.toreadonly()
+            else:  # Python < 3.8
+                self._buffer = memoryview(bytes(view))
+        magic, version, self._count = HEADER.unpack_from(self._buffer)
+        if (magic != MAGIC) or (version != VERSION):
+            raise ValueError("Buffer doesn't contain a schema registry")
+        self._shm: Optional["shared_memory.SharedMemory"] = None
+
+    @classmethod
+    def attach(cls, name: str) -> "SharedSchemaRegistry":
+        """View of a block made by ``publish``. Requires Python 3.8 or later."""
+        from multiprocessing import shared_memory
+
+        try:
+            shm = shared_memory.SharedMemory(name=name, track=False)
+        except TypeError:  # Python < 3.13
+            shm = shared_memory.SharedMemory(name=name)
+        self = cls(shm.buf)
+        self._shm = shm
+        return self
+
+    def close(self) -> None:
+        self._buffer.release()
+        if self._shm is not None:
+            self._shm.close()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __contains__(self, key: Tuple[str, str]) -> bool:
+        return self._find(fingerprint(*key)) is not None
+
+    def get(self, spec: str, from_: str) -> Schema:
+        entry = self._find(fingerprint(spec, from_))
+        if entry is None:
+            raise KeyError((spec, from_))
+        return _load_schema(self._buffer, *entry)
+
+    def _find(self, key: bytes) -> Optional[Tuple[int, int]]:
+        index = _Index(self._buffer, self._count)
+        i = bisect_left(index, key)
+        if (i < self._count) and (index[i] == key):
+            _, position, size = INDEX.unpack_from(
+                self._buffer, HEADER.size + INDEX.size * i
+            )
+            return position, size
+
+
+class _Index:
+    """Sequence of fingerprints in the buffer, for ``bisect``."""
+
+    def __init__(self, buffer: memoryview, count: int) -> None:
+        self.buffer, self.count = buffer, count
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __getitem__(self, i: int) -> bytes:
+        start = HEADER.size + INDEX.size * i
+        return bytes(self.buffer[start : start + FINGERPRINT_SIZE])
+
+
+def _dump_strings(*strings: str) -> bytes:
+    encoded = [s.encode() for s in strings]
+    return b"".join(LENGTH.pack(len(s)) + s for s in encoded)
+
+
+def _dump_schema(schema: Schema) -> bytes:
+    n_fields, n_translations = len(schema.offsets), len(schema.translations)
+    return b"".join(
+        [
+            ENTRY.pack(schema.itemsize, n_fields, n_translations),
+            struct.pack(f"<{n_fields}I", *schema.offsets),
+            _dump_strings(schema.spec, schema.from_),
+            *(_dump_strings(*item) for item in schema.translations.items()),
+        ]
+    )
+
+
+def _load_schema(buffer: memoryview, position: int, size: int) -> Schema:
+    itemsize, n_fields, n_translations = ENTRY.unpack_from(buffer, position)
+    position += ENTRY.size
+    offsets = struct.unpack_from(f"<{n_fields}I", buffer, position)
+    position += 4 * n_fields
+
+    strings: List[str] = []
+    for _ in range(2 + 2 * n_translations):
+        (length,) = LENGTH.unpack_from(buffer, position)
+        position += LENGTH.size
+        strings.append(bytes(buffer[position : position + length]).decode())
+        position += length
+
+    spec, from_, *translations = strings
+    translations = dict(zip(translations[::2], translations[1::2]))
+    return Schema(spec, from_, itemsize, offsets, translations)
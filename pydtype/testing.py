@@ -0,0 +1,216 @@
+"""Random spec corpus and differential conformance checks.
+
+Specs are generated from a seed, so the same corpus can be used to verify an
+optimization with :func:`check` and to measure it in ``benchmarks/``.
+
+Examples
+--------
+>>> for spec in corpus("numpy", size=1000, seed=0):
+...     check(spec, "numpy")
+
+"""
+
+import random
+import struct
+from typing import List, Optional, Sequence, Tuple
+
+from .core.record import nbytes
+from .translator import framework, translate
+from .typing import Shape
+from .validation import Error, try_translate
+
+# Formats whose size doesn't depend on the platform, as (character, is string)
+NUMPY_FORMATS = [
+    ("?", False),
+    ("i1", False),
+    ("i2", False),
+    ("i4", False),
+    ("i8", False),
+    ("u1", False),
+    ("u2", False),
+    ("u4", False),
+    ("u8", False),
+    ("f2", False),
+    ("f4", False),
+    ("f8", False),
+    ("S", True),
+    ("a", True),
+]
+NUMPY_NONPORTABLE_FORMATS = [
+    ("c8", False),
+    ("c16", False),
+    ("m8", False),
+    ("M8", False),
+    ("U", True),
+]
+NUMPY_BYTE_ORDERS = ["", "<", ">", "="]
+
+STRUCT_FORMATS = [
+    ("c", False),
+    ("b", False),
+    ("B", False),
+    ("?", False),
+    ("h", False),
+    ("H", False),
+    ("i", False),
+    ("I", False),
+    ("l", False),
+    ("L", False),
+    ("q", False),
+    ("Q", False),
+    ("e", False),
+    ("f", False),
+    ("d", False),
+    ("s", True),
+]
+STRUCT_NONPORTABLE_FORMATS = [
+    ("x", False),
+]
+# Native mode "@" is excluded, as it inserts alignment padding
+STRUCT_BYTE_ORDERS = ["<", ">", "=", "!"]
+
+
+def _n_fields(rng: random.Random, max_fields: int) -> int:
+    # Log-uniform, so that small and huge records are equally represented
+    return min(int(max_fields ** rng.random()), max_fields)
+
+
+def numpy_spec(
+    rng: random.Random,
+    max_fields: int = 100,
+    max_ndim: int = 3,
+    max_length: int = 64,
+    portable: bool = False,
+) -> str:
+    """Generate a random NumPy dtype string.
+
+    If ``portable``, only formats and shapes that struct can express are used.
+
+    """
+    formats = NUMPY_FORMATS if portable else NUMPY_FORMATS + NUMPY_NONPORTABLE_FORMATS
+    max_ndim = min(max_ndim, 1) if portable else max_ndim
+    endian = rng.choice(NUMPY_BYTE_ORDERS)
+
+    fields = []
+    for _ in range(_n_fields(rng, max_fields)):
+        character, is_string = rng.choice(formats)
+        if is_string:
+            character += str(rng.randint(1, max_length))
+        ndim = rng.randint(0, max_ndim)
+        shape = [rng.randint(1, 8) for _ in range(ndim)]
+        if (ndim == 0) or (portable and not is_string):
+            # Portable numeric arrays are written as count prefix of struct
+            fields.append(endian + (f"({shape[0]},)" if ndim else "") + character)
+        else:
+            dims = ",".join(map(str, shape)) + ("," if ndim == 1 else "")
+            fields.append(f"{endian}({dims}){character}")
+    return ",".join(fields)
+
+
+def struct_spec(
+    rng: random.Random,
+    max_fields: int = 100,
+    max_count: int = 16,
+    portable: bool = False,
+    **_,
+) -> str:
+    """Generate a random struct format in standard size and alignment.
+
+    If ``portable``, only formats that NumPy can express are used.
+
+    """
+    formats = (
+        STRUCT_FORMATS if portable else STRUCT_FORMATS + STRUCT_NONPORTABLE_FORMATS
+    )
+    fields = []
+    for _ in range(_n_fields(rng, max_fields)):
+        character, is_string = rng.choice(formats)
+        count = rng.randint(0 if is_string else 1, max_count)
+        fields.append(f"{count}{character}" if rng.random() < 0.5 else character)
+    return rng.choice(STRUCT_BYTE_ORDERS) + "".join(fields)
+
+
+def corpus(
+    from_: str, size: int = 100, seed: int = 0, max_fields: int = 100, **kwargs
+) -> List[str]:
+    """Generate ``size`` random specs of the framework, reproducibly from ``seed``.
+
+    Extra keyword arguments are passed to :func:`numpy_spec` or :func:`struct_spec`.
+
+    """
+    generate = {"numpy": numpy_spec, "struct": struct_spec}[from_.lower()]
+    rng = random.Random(seed)
+    return [generate(rng, max_fields, **kwargs) for _ in range(size)]
+
+
+def itemsize(spec: str, from_: str) -> int:
+    """Size of a record computed from decoded spec, without any alignment."""
+    decoded = framework[from_.lower()].decode(spec)
+    return sum(nbytes(s, shape) for s, shape in _fields(decoded))
+
+
+def oracle_itemsize(spec: str, from_: str) -> Optional[int]:
+    """Size of a record reported by the framework itself, if available."""
+    from_ = from_.lower()
+    if from_ == "struct":
+        return struct.calcsize(spec)
+    if from_ == "numpy":
+        try:
+            import numpy
+        except ImportError:
+            return None
+        return numpy.dtype(spec).itemsize
+
+
+def check(spec: str, from_: str, to: Sequence[str] = ("numpy", "struct")) -> None:
+    """Check decode, encode and translate of a spec against the frameworks.
+
+    Translations to frameworks the spec isn't expressible in are skipped, but any
+    other error fails the check. Unlike ``assert``, checks are kept under ``-O``.
+
+    Raises
+    ------
+    AssertionError
+        If any of size or round-trip conformance is violated.
+
+    """
+    from_ = from_.lower()
+    expected = itemsize(spec, from_)
+    oracle = oracle_itemsize(spec, from_)
+    if oracle not in (None, expected):
+        raise AssertionError(f"{spec!r}: size {expected} != {oracle}")
+
+    parser = framework[from_]
+    decoded = parser.decode(spec)
+    reencoded = parser.encode(*decoded)
+    if _summary(parser.decode(reencoded)) != _summary(decoded):
+        raise AssertionError(f"{spec!r}: round trip through {reencoded!r} changed it")
+
+    for target in to:
+        result = try_translate(spec, from_, target)
+        if result.error is Error.NOT_EXPRESSIBLE:
+            continue
+        if not result.ok:
+            raise AssertionError(f"{spec!r} -> {target}: {result.error.name}")
+        translated = result.value
+        if (target == "struct") and (translated[:1] not in "@=<>!"):
+            # Without byte order struct aligns fields, though NumPy doesn't
+            translated = "=" + translated
+        size = oracle_itemsize(translated, target)
+        if size is None:
+            size = itemsize(translated, target)
+        if size != expected:
+            raise AssertionError(f"{spec!r} -> {translated!r}: size {size}")
+        back = translate(translated, target, from_)
+        if itemsize(back, from_) != expected:
+            raise AssertionError(f"{spec!r} -> {back!r}")
+
+
+def _fields(decoded: list) -> list:
+    return [s for s in decoded if not isinstance(s, str)]
+
+
+def _summary(decoded: list) -> Tuple[Optional[str], List[Tuple[str, int, Shape]]]:
+    endian = decoded[0] if isinstance(decoded[0], str) else None
+    fields = [(s.kind, s.byte_size, tuple(shape)) for s, shape in _fields(decoded)]
+    return endian, fields
@@ -1,18 +1,109 @@
-from typing import Dict
+from typing import Dict, Tuple, Type, Union
 
+from . import instrumentation
+from .abi import ABI
 from .core import Parser
-from .frameworks import NumPyParser, StructParser
+from .frameworks import (
+    ArrayParser,
+    ArrowParser,
+    CTypesParser,
+    FITSParser,
+    NumPyParser,
+    StructParser,
+)
 
-parser_implementations = [NumPyParser, StructParser]
+parser_implementations = [
+    NumPyParser,
+    StructParser,
+    FITSParser,
+    ArrayParser,
+    CTypesParser,
+    ArrowParser,
+]
 framework: Dict[str, Parser] = {p.framework.lower(): p for p in parser_implementations}
 
+ABISpec = Union[None, str, ABI, Tuple[Union[None, str, ABI], Union[None, str, ABI]]]
 
-def translate(specifier: str, from_: str, to: str, strategy: str = "exact") -> str:
+
+def translate(
+    specifier: str,
+    from_: str,
+    to: str,
+    strategy: str = "exact",
+    abi: ABISpec = None,
+    flatten: bool = False,
+) -> str:
+    """Translate data type specifier from a framework to another.
+
+    Parameters
+    ----------
+    abi
+        Platform the native types (e.g. ``long`` or ``size_t``) are sized for, such
+        as ``"lp64"``, ``"llp64"`` or ``"ilp32"``; see :mod:`pydtype.abi`. A pair
+        gives the ABI of ``specifier`` and of the result separately. If omitted,
+        the default tables are used: NumPy, ctypes and array size native types for
+        the host, while struct uses its standard sizes (e.g. 4 bytes of ``l``) and
+        can't size ``n``, ``N`` and ``P`` without an ABI.
+    flatten
+        If True, multi-dimensional arrays are written as a single count of all
+        elements, see :meth:`StructFormat.with_shape`. Only struct supports it.
+
+    Notes
+    -----
+    This function is reentrant and safe to call from any number of threads without
+    locking; it only reads ``framework`` mapping and immutable ``Types`` tables, and
+    caches elsewhere in this package are ``functools.lru_cache`` or guarded by a
+    lock. Custom parsers should be added to ``framework`` before threads start to
+    use it.
+
+    """
     from_, to = from_.lower(), to.lower()
-    decoded = framework[from_].decode(specifier)
+    source, target = _parsers(from_, to, abi)
+    options = _flatten(target) if flatten else {}
+    if instrumentation.enabled:
+        return _translate_instrumented(
+            specifier, from_, to, strategy, source, target, options
+        )
+
+    decoded = source.decode(specifier)
     try:
-        return framework[to].encode(*decoded, strategy=strategy)
+        return target.encode(*decoded, strategy=strategy, **options)
     except StopIteration:
         raise ValueError(
             f"Cannot translate {specifier} from {from_} to {to} in {strategy} mode."
         )
+
+
+def _parsers(from_: str, to: str, abi: ABISpec) -> Tuple[Type[Parser], Type[Parser]]:
+    if abi is None:
+        return framework[from_], framework[to]
+    source_abi, target_abi = abi if isinstance(abi, tuple) else (abi, abi)
+    return framework[from_].with_abi(source_abi), framework[to].with_abi(target_abi)
+
+
+def _flatten(target: Type[Parser]) -> Dict[str, bool]:
+    if not issubclass(target, StructParser):
+        raise ValueError(f"{target.framework} doesn't support flatten")
+    return {"flatten": True}
+
+
+def _translate_instrumented(
+    specifier: str,
+    from_: str,
+    to: str,
+    strategy: str,
+    source: Type[Parser],
+    target: Type[Parser],
+    options: Dict[str, bool],
+) -> str:
+    info = dict(spec=specifier, from_=from_, to=to, strategy=strategy)
+    with instrumentation.timer("translate", **info):
+        with instrumentation.timer("decode", **info):
+            decoded = source.decode(specifier)
+        try:
+            with instrumentation.timer("encode", **info):
+                return target.encode(*decoded, strategy=strategy, **options)
+        except StopIteration:
+            raise ValueError(
+                f"Cannot translate {specifier} from {from_} to {to} in {strategy} mode."
+            )
@@ -0,0 +1,184 @@
+"""Decode, translate and validate specs without raising.
+
+Constructing and unwinding exceptions dominates bulk jobs where many inputs are
+invalid. Functions here return :class:`Result` instead, carrying either the value or
+an error code with the position of the offending token in the spec.
+
+Examples
+--------
+>>> try_translate("<i4,zz", "numpy", "struct")
+Result(value=None, error=<Error.UNSUPPORTED: 2>, position=4)
+>>> [r.value for r in validate(["<i4", "<f8", "O"], "numpy", sizes=[8, 12, 8])]
+[4, None, None]
+
+"""
+
+from enum import IntEnum
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from .core import Parser
+from .core.record import layout
+from .translator import framework
+
+BYTE_ORDER_MARKS = "@=<>!|"
+
+
+class Error(IntEnum):
+
+    OK = 0
+    UNKNOWN_FRAMEWORK = 1
+    # No type matches the token
+    UNSUPPORTED = 2
+    # Byte order mark conflicting with another, or at a position not allowed
+    BYTE_ORDER = 3
+    # Variable length or opaque field, such as NumPy object
+    UNKNOWN_SIZE = 4
+    # No type of the same kind and size in the target framework
+    NOT_EXPRESSIBLE = 5
+    # Declared payload size isn't a whole number of items
+    SIZE_MISMATCH = 6
+
+
+class Result(NamedTuple):
+    """Value on success, otherwise the error and position of the offending token.
+
+    A tuple, as it's cheaper to create than other classes. Position is None if the
+    error cannot be attributed to a token.
+
+    """
+
+    value: Any = None
+    error: Error = Error.OK
+    position: Optional[int] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is Error.OK
+
+    def unwrap(self) -> Any:
+        """Return the value, or raise ValueError describing the error."""
+        if self.ok:
+            return self.value
+        at = "" if self.position is None else f" at position {self.position}"
+        raise ValueError(f"{self.error.name}{at}")
+
+
+def try_decode(spec: str, from_: str) -> Result:
+    """``Parser.decode``, without raising."""
+    return _decode(spec, from_)[0]
+
+
+def try_translate(spec: str, from_: str, to: str, strategy: str = "exact") -> Result:
+    """``translate``, without raising."""
+    decoded, positions = _decode(spec, from_)
+    target = framework.get(to.lower())
+    if not decoded.ok:
+        return decoded
+    if target is None:
+        return Result(error=Error.UNKNOWN_FRAMEWORK)
+
+    if not hasattr(target, "table"):
+        try:
+            return Result(target.encode(*decoded.value, strategy=strategy))
+        except (ValueError, StopIteration):
+            return Result(error=Error.NOT_EXPRESSIBLE)
+
+    # Fields are encoded from the types found here, as ``encode`` would search the
+    # same types again
+    values = decoded.value
+    endian = values[0] if values and isinstance(values[0], str) else None
+    fields = [s for s in values if not isinstance(s, str)]
+    formats = []
+    for (specifier, shape), position in zip(fields, positions):
+        found = target.table.get(specifier.kind, specifier.byte_size, strategy)
+        if found is None:
+            return Result(error=Error.NOT_EXPRESSIBLE, position=position)
+        try:
+            formats.append(found.with_shape(*shape))
+        except ValueError:
+            return Result(error=Error.NOT_EXPRESSIBLE, position=position)
+    # Constraints of the target on the whole spec, e.g. homogeneity of type code
+    try:
+        return Result(target.join(endian, formats))
+    except ValueError:
+        return Result(error=Error.NOT_EXPRESSIBLE)
+
+
+def validate(
+    specs: Iterable[str], from_: str, sizes: Optional[Iterable[int]] = None
+) -> List[Result]:
+    """Check specs, and payload sizes declared for them, against their itemsize.
+
+    Parameters
+    ----------
+    specs
+        Specs to check. Each distinct spec is decoded once.
+    from_
+        Framework of the specs.
+    sizes
+        Payload size in bytes paired with each spec; valid if it holds a whole
+        number of items.
+
+    Returns
+    -------
+    Result per spec, value of which is the itemsize.
+
+    """
+    pairs = ((s, None) for s in specs) if sizes is None else zip(specs, sizes)
+    cache: Dict[str, Result] = {}
+    results = []
+    for spec, size in pairs:
+        result = cache.get(spec)
+        if result is None:
+            result = cache[spec] = _itemsize(spec, from_)
+        if result.ok and (size is not None) and not _whole(size, result.value):
+            result = Result(error=Error.SIZE_MISMATCH)
+        results.append(result)
+    return results
+
+
+def _decode(spec: str, from_: str) -> Tuple[Result, List[Optional[int]]]:
+    parser = framework.get(from_.lower())
+    if parser is None:
+        return Result(error=Error.UNKNOWN_FRAMEWORK), []
+    if parser.tokenize.__func__ is Parser.tokenize.__func__:
+        # Parsers that don't tokenize can only be validated by catching their errors
+        return _decode_raising(parser, spec)
+    endian, tokens = parser.tokenize(spec)
+
+    decoded: List[Any] = [] if endian is None else [endian]
+    for position, token in tokens:
+        found = parser.table.lookup(token)
+        if found is None:
+            error = Error.BYTE_ORDER if _is_byte_order(token) else Error.UNSUPPORTED
+            return Result(error=error, position=position), []
+        decoded.append(found)
+    return Result(decoded), [position for position, _ in tokens]
+
+
+def _decode_raising(parser: Parser, spec: str) -> Tuple[Result, List[Optional[int]]]:
+    try:
+        decoded = parser.decode(spec)
+    except (ValueError, StopIteration):
+        return Result(error=Error.UNSUPPORTED), []
+    return Result(decoded), [None] * len(decoded)
+
+
+def _is_byte_order(token: str) -> bool:
+    return (len(token) > 0) and all(c in BYTE_ORDER_MARKS for c in token)
+
+
+def _itemsize(spec: str, from_: str) -> Result:
+    decoded, positions = _decode(spec, from_)
+    if not decoded.ok:
+        return decoded
+    fields = [s for s in decoded.value if not isinstance(s, str)]
+    for (specifier, _), position in zip(fields, positions):
+        if specifier.byte_size is None:
+            return Result(error=Error.UNKNOWN_SIZE, position=position)
+    aligned = framework[from_.lower()].aligned(decoded.value)
+    return Result(layout(*fields, aligned=aligned)[1])
+
+
+def _whole(size: int, itemsize: int) -> bool:
+    return (size % itemsize == 0) if itemsize > 0 else (size == 0)
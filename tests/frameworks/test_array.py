@@ -0,0 +1,59 @@
+import array
+import struct
+
+import pytest
+
+import pydtype
+from pydtype.frameworks import ArrayParser
+from pydtype.frameworks.array import cast
+
+
+class TestArrayParser:
+    @pytest.mark.parametrize(
+        "specifier, kind",
+        [
+            ("b", "int"),
+            ("B", "uint"),
+            ("h", "int"),
+            ("H", "uint"),
+            ("i", "int"),
+            ("I", "uint"),
+            ("l", "int"),
+            ("L", "uint"),
+            ("q", "int"),
+            ("Q", "uint"),
+            ("f", "float"),
+            ("d", "float"),
+        ],
+    )
+    def test_decode(self, specifier, kind):
+        _, (spec, shape) = ArrayParser.decode(specifier)
+        assert spec.kind == kind
+        assert spec.byte_size == array.array(specifier).itemsize
+        assert shape == ()
+
+    @pytest.mark.parametrize(
+        "input_,from_,expected",
+        [
+            ("f8", "numpy", "d"),
+            ("(64,)f4", "numpy", "f"),
+            ("i2,i2", "numpy", "h"),
+            ("3B", "struct", "B"),
+        ],
+    )
+    def test_translate(self, input_, from_, expected):
+        assert pydtype.translate(input_, from_, "array") == expected
+
+    @pytest.mark.parametrize("input_,from_", [("i4,f8", "numpy"), ("5s", "struct")])
+    def test_translate_unsupported(self, input_, from_):
+        with pytest.raises(ValueError):
+            pydtype.translate(input_, from_, "array")
+
+
+def test_cast():
+    buffer = bytearray(struct.pack("=4d", 0.5, 1.5, 2.5, 3.5))
+    view = cast(buffer, "(4,)f8", "numpy")
+    assert view.tolist() == [0.5, 1.5, 2.5, 3.5]
+
+    view[0] = 9.0
+    assert struct.unpack_from("=d", buffer)[0] == 9.0
@@ -0,0 +1,119 @@
+import pytest
+
+import pydtype
+from pydtype.frameworks import ArrowParser, NumPyParser
+
+from ..conftest import get_spec
+
+
+class TestArrowParser:
+    @pytest.mark.parametrize(
+        "specifier, shape, kind, byte_size",
+        [
+            ("c", (), "int", 1),
+            ("C", (), "uint", 1),
+            ("s", (), "int", 2),
+            ("S", (), "uint", 2),
+            ("i", (), "int", 4),
+            ("I", (), "uint", 4),
+            ("l", (), "int", 8),
+            ("L", (), "uint", 8),
+            ("e", (), "float", 2),
+            ("f", (), "float", 4),
+            ("g", (), "float", 8),
+            ("w:16", (16,), "bytes", 1),
+            ("+w:3{g}", (3,), "float", 8),
+            ("+w:4{+w:3{i}}", (4, 3), "int", 4),
+            ("+w:2{w:8}", (8, 2), "bytes", 1),
+            ("b", (), "bool", None),
+            ("u", (), "utf8", None),
+        ],
+    )
+    def test_decode_single_format(self, specifier, shape, kind, byte_size):
+        endian, (spec, _shape) = ArrowParser.decode(specifier)
+        assert endian == "<"
+        assert spec.kind == kind
+        assert spec.byte_size == byte_size
+        assert _shape == shape
+
+    @pytest.mark.parametrize("specifier", ["i, +w:3{g}, w:16", "+s{i,+w:3{g},w:16}"])
+    def test_decode_multiple_formats(self, specifier):
+        _, *spec = ArrowParser.decode(specifier)
+        assert [(s.kind, s.byte_size, shape) for s, shape in spec] == [
+            ("int", 4, ()),
+            ("float", 8, (3,)),
+            ("bytes", 1, (16,)),
+        ]
+
+    def test_decode_nested_struct(self):
+        with pytest.raises(ValueError):
+            ArrowParser.decode("i,+s{f,f}")
+
+    @pytest.mark.parametrize(
+        "spec, expected",
+        [
+            ([(get_spec("int", 2), ())], "s"),
+            ([(get_spec("float", 4), (4, 3))], "+w:4{+w:3{f}}"),
+            ([(get_spec("bytes", 1), (5,))], "w:5"),
+            (
+                ["<", (get_spec("uint", 8), ()), (get_spec("bytes", 1), (5, 2))],
+                "L,+w:2{w:5}",
+            ),
+        ],
+    )
+    def test_encode(self, spec, expected):
+        assert ArrowParser.encode(*spec) == expected
+
+    def test_encode_big_endian(self):
+        with pytest.raises(ValueError):
+            ArrowParser.encode(">", (get_spec("int", 4), ()))
+
+
+class TestArrowRecord:
+    def test_decode_record(self):
+        record = ArrowParser.decode_record("+s{i,+w:2{+s{f,w:3}},g}")
+        assert [(f.name, f.offset, f.shape) for f in record.fields] == [
+            ("f0", 0, ()),
+            ("f1", 4, (2,)),
+            ("f2", 18, ()),
+        ]
+        assert record.fields[1].specifier.itemsize == 7
+        assert record.itemsize == 26
+
+    def test_encode_record(self):
+        record = NumPyParser.decode_record(
+            [("a", "<i8"), ("b", [("x", "<f4"), ("y", "S2")], (3,))]
+        )
+        assert ArrowParser.encode_record(record) == "l,+w:3{+s{f,w:2}}"
+
+
+class TestTranslate:
+    @pytest.mark.parametrize(
+        "input_,from_,to,expected",
+        [
+            ("<i4,(3,)f8,S16", "numpy", "arrow", "i,+w:3{g},w:16"),
+            ("(64,64)f4", "numpy", "arrow", "+w:64{+w:64{f}}"),
+            ("i,+w:3{g},w:16", "arrow", "numpy", "<i4,<(3,)f8,<S16"),
+            ("C,s,l", "arrow", "struct", "<Bhq"),
+            ("<HQ", "struct", "arrow", "S,L"),
+        ],
+    )
+    def test_translate(self, input_, from_, to, expected):
+        assert pydtype.translate(input_, from_, to) == expected
+
+    @pytest.mark.parametrize(
+        "input_,from_,to",
+        [
+            ("?", "numpy", "arrow"),
+            ("b", "arrow", "numpy"),
+            (">i4", "numpy", "arrow"),
+            # Variable length types have no counterpart
+            ("u", "arrow", "numpy"),
+            ("z", "arrow", "fits"),
+            ("O", "numpy", "arrow"),
+            ("3x", "struct", "arrow"),
+        ],
+    )
+    def test_not_zero_copy(self, input_, from_, to):
+        with pytest.raises(ValueError):
+            pydtype.translate(input_, from_, to)
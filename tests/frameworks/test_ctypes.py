@@ -0,0 +1,97 @@
+import ctypes
+import struct
+
+import pytest
+
+import pydtype
+from pydtype.frameworks import CTypesParser
+from pydtype.frameworks.ctypes import structure
+
+from ..conftest import get_spec
+
+
+class TestCTypesParser:
+    @pytest.mark.parametrize(
+        "specifier, shape, kind, byte_size",
+        [
+            ("c_bool", (), "bool", 1),
+            ("c_int8", (), "int", 1),
+            ("c_uint16", (), "uint", 2),
+            ("c_int32 * 3", (3,), "int", 4),
+            ("c_uint64*3*4", (4, 3), "uint", 8),
+            ("c_double", (), "float", 8),
+            ("c_char", (1,), "bytes", 1),
+            ("c_char*10", (10,), "bytes", 1),
+            ("c_char*10*3", (10, 3), "bytes", 1),
+        ],
+    )
+    def test_decode(self, specifier, shape, kind, byte_size):
+        spec, _shape = CTypesParser.decode(specifier)[0]
+        assert spec.kind == kind
+        assert spec.byte_size == byte_size
+        assert _shape == shape
+
+    @pytest.mark.parametrize(
+        "spec, expected",
+        [
+            ([(get_spec("int", 4), ())], "c_int32"),
+            ([(get_spec("float", 4), (4, 3))], "c_float*3*4"),
+            ([(get_spec("bytes", 1), (10, 4, 3))], "c_char*10*3*4"),
+            (
+                [(get_spec("char", 1), ()), (get_spec("uint", 2), (2,))],
+                "c_char,c_uint16*2",
+            ),
+        ],
+    )
+    def test_encode(self, spec, expected):
+        assert CTypesParser.encode(*spec) == expected
+
+    @pytest.mark.parametrize(
+        "input_,from_,expected",
+        [
+            ("i4,(3,)f8,S5", "numpy", "c_int32,c_double*3,c_char*5"),
+            ("c_int16,c_float*2", "ctypes", "h2f"),
+        ],
+    )
+    def test_translate(self, input_, from_, expected):
+        to = "ctypes" if from_ != "ctypes" else "struct"
+        assert pydtype.translate(input_, from_, to) == expected
+
+
+class TestStructure:
+    def test_cached(self):
+        assert structure("<id", "struct") is structure("<id", "struct")
+
+    @pytest.mark.parametrize(
+        "spec, from_, fmt, base",
+        [
+            ("<hd4s", "struct", "<hd4s", ctypes.LittleEndianStructure),
+            (">hd4s", "struct", ">hd4s", ctypes.BigEndianStructure),
+            ("hd4s", "struct", "hd4s", ctypes.Structure),
+            ("i2,f8,S4", "numpy", "=hd4s", ctypes.Structure),
+        ],
+    )
+    def test_layout(self, spec, from_, fmt, base):
+        Record = structure(spec, from_)
+        assert issubclass(Record, base)
+        # C pads the end of structure to its alignment, unlike struct
+        fmt += "0d"
+        assert ctypes.sizeof(Record) == struct.calcsize(fmt)
+
+        buffer = bytearray(struct.pack(fmt, -3, 2.5, b"abcd"))
+        record = Record.from_buffer(buffer)
+        assert (record.f0, record.f1, record.f2) == (-3, 2.5, b"abcd")
+
+        struct.pack_into(fmt, buffer, 0, 7, 0.25, b"wxyz")
+        assert (record.f0, record.f1, record.f2) == (7, 0.25, b"wxyz")
+
+    def test_array_field(self):
+        Record = structure(">(2,3)i4", "numpy")
+        buffer = bytearray(struct.pack(">6i", *range(6)))
+        record = Record.from_buffer(buffer)
+        assert [list(row) for row in record.f0] == [[0, 1, 2], [3, 4, 5]]
+
+    @pytest.mark.parametrize("spec, from_", [("@P", "struct"), ("<e", "struct")])
+    def test_not_expressible(self, spec, from_):
+        with pytest.raises(ValueError):
+            structure(spec, from_)
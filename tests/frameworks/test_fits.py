@@ -0,0 +1,129 @@
+import struct
+
+import pytest
+
+import pydtype
+from pydtype.frameworks import FITSParser
+from pydtype.frameworks.fits import open_bintable
+
+from ..conftest import get_spec
+
+
+class TestFITSParser:
+    @pytest.mark.parametrize(
+        "specifier, shape, kind, byte_size",
+        [
+            ("L", (), "logical", 1),
+            ("1B", (), "uint", 1),
+            ("1I", (), "int", 2),
+            ("J", (), "int", 4),
+            ("1K", (), "int", 8),
+            ("A", (1,), "bytes", 1),
+            ("20A", (20,), "bytes", 1),
+            ("10E", (10,), "float", 4),
+            ("1D", (), "float", 8),
+            ("2C", (2,), "complex", 8),
+            ("3M", (3,), "complex", 16),
+            ("8X", (8,), "bit", None),
+            ("1PE(100)", (), "descriptor", 8),
+            ("Q", (), "descriptor", 16),
+        ],
+    )
+    def test_decode_single_format(self, specifier, shape, kind, byte_size):
+        endian, (spec, _shape) = FITSParser.decode(specifier)
+        assert endian == ">"
+        assert spec.kind == kind
+        assert spec.byte_size == byte_size
+        assert _shape == shape
+
+    def test_decode_multiple_formats(self):
+        endian, *spec = FITSParser.decode("1J, 10E,20A")
+        assert endian == ">"
+        assert [(s.kind, s.byte_size, shape) for s, shape in spec] == [
+            ("int", 4, ()),
+            ("float", 4, (10,)),
+            ("bytes", 1, (20,)),
+        ]
+
+    @pytest.mark.parametrize(
+        "spec, expected",
+        [
+            ([(get_spec("int", 4), ())], "1J"),
+            ([(get_spec("float", 8), (3,))], "3D"),
+            ([(get_spec("float", 4), (64, 64))], "4096E"),
+            ([(get_spec("bytes", 1), (8, 3))], "24A"),
+            (["<", (get_spec("int", 2), ()), (get_spec("uint", 1), ())], "1I,1B"),
+        ],
+    )
+    def test_encode(self, spec, expected):
+        assert FITSParser.encode(*spec) == expected
+
+
+class TestTranslate:
+    @pytest.mark.parametrize(
+        "input_,from_,to,expected",
+        [
+            ("1J,10E,20A", "fits", "numpy", ">i4,>(10,)f4,>S20"),
+            ("1J,10E,20A", "fits", "struct", ">i10f20s"),
+            ("1D,1K", "fits", "struct", ">dq"),
+            ("<i4,(3,)f8", "numpy", "fits", "1J,3D"),
+            ("h5s", "struct", "fits", "1I,5A"),
+        ],
+    )
+    def test_translate(self, input_, from_, to, expected):
+        assert pydtype.translate(input_, from_, to) == expected
+
+    @pytest.mark.parametrize(
+        "input_,from_,to",
+        [
+            ("1J,8X", "fits", "struct"),
+            ("8X", "fits", "numpy"),
+            ("1PE(100)", "fits", "numpy"),
+            ("3x", "struct", "fits"),
+        ],
+    )
+    def test_translate_without_counterpart(self, input_, from_, to):
+        with pytest.raises(ValueError):
+            pydtype.translate(input_, from_, to)
+
+
+def test_open_bintable(tmp_path):
+    pytest.importorskip("numpy")
+
+    header = b" " * 2880
+    rows = [(i, i / 2, b"row%d" % i) for i in range(5)]
+    data = b"".join(struct.pack(">id5s", *row) for row in rows)
+    path = tmp_path / "table.fits"
+    path.write_bytes(header + data)
+
+    table = open_bintable(str(path), "1J,1D,5A", offset=2880, nrows=5)
+    assert table["f0"].tolist() == [r[0] for r in rows]
+    assert table["f1"].tolist() == [r[1] for r in rows]
+    assert table["f2"].tolist() == [r[2] for r in rows]
+
+
+def test_open_bintable_logical(tmp_path):
+    pytest.importorskip("numpy")
+
+    path = tmp_path / "table.fits"
+    path.write_bytes(b"TF\x00" + b"FT\x00")
+
+    table = open_bintable(str(path), "2L,1B", nrows=2)
+    assert table["f0"].tolist() == [[b"T", b"F"], [b"F", b"T"]]
+    assert (table["f0"] == b"T").tolist() == [[True, False], [False, True]]
+    assert table["f1"].tolist() == [0, 0]
+
+
+def test_open_bintable_bits_and_descriptors(tmp_path):
+    np = pytest.importorskip("numpy")
+
+    rows = [(1, 0b10100000, 0b01000000, 3, 16), (2, 0xFF, 0x80, 0, 0)]
+    data = b"".join(struct.pack(">iBBii", *row) for row in rows)
+    path = tmp_path / "table.fits"
+    path.write_bytes(data)
+
+    table = open_bintable(str(path), "1J,10X,1PE(3)", nrows=2)
+    assert table.dtype.itemsize == 14
+    bits = np.unpackbits(table["f1"], axis=1)[0, :10]
+    assert "".join(map(str, bits)) == "1010000001"
+    assert table["f2"].tolist() == [[3, 16], [0, 0]]
@@ -1,3 +1,5 @@
+import sys
+
 import pytest
 
 from pydtype.frameworks import NumPyParser
@@ -33,7 +35,7 @@ class TestStructParser:
             ("M8", (), "datetime", 8),
             ("S", (1,), "bytes", 1),
             ("a", (1,), "bytes", 1),
-            ("U", (1,), "str", 1),
+            ("U", (1,), "str", 4),
             # Unknown
             ("c", (), "char", 1),
         ],
@@ -58,7 +60,7 @@ class TestStructParser:
             ("c32,m", ((), ()), ["complex", "timedelta"], [32, 8]),
             ("m8, M", ((), ()), ["timedelta", "datetime"], [8, 8]),
             ("M8,S", ((), (1,)), ["datetime", "bytes"], [8, 1]),
-            ("a10, U5", ((10,), (5,)), ["bytes", "str"], [1, 1]),
+            ("a10, U5", ((10,), (5,)), ["bytes", "str"], [1, 4]),
         ],
     )
     def test_decode_multiple_formats(self, specifier, shape, kind, byte_size):
@@ -96,7 +98,7 @@ class TestStructParser:
             ("(3, 4, 5, 6)M8", (3, 4, 5, 6), "datetime", 8),
             ("(3, 7)S", (1, 3, 7), "bytes", 1),
             ("(3, 7)a11", (11, 3, 7), "bytes", 1),
-            ("(3,)U", (1, 3), "str", 1),
+            ("(3,)U", (1, 3), "str", 4),
         ],
     )
     def test_decode_single_array(self, specifier, shape, kind, byte_size):
@@ -119,7 +121,7 @@ class TestStructParser:
             ("3c32,  4   m", ((3,), (4,)), ["complex", "timedelta"], [32, 8]),
             ("(2,2,2)m8, 5M", ((2, 2, 2), (5,)), ["timedelta", "datetime"], [8, 8]),
             ("5M8,(7,9)S", ((5,), (1, 7, 9)), ["datetime", "bytes"], [8, 1]),
-            ("90a10, (7,5)U5", ((10, 90), (5, 7, 5)), ["bytes", "str"], [1, 1]),
+            ("90a10, (7,5)U5", ((10, 90), (5, 7, 5)), ["bytes", "str"], [1, 4]),
         ],
     )
     def test_decode_multiple_array(self, specifier, shape, kind, byte_size):
@@ -130,6 +132,23 @@ class TestStructParser:
             assert spec.byte_size == _byte_size
             assert ashape == _shape
 
+    def test_decode_byte_order_per_field(self):
+        # Byte order only applies to the field it prefixes; others are native
+        native, other = ("<", ">") if sys.byteorder == "little" else (">", "<")
+        assert NumPyParser.decode(f"{other}i4,{other}f8,S3")[0] == other
+        assert NumPyParser.decode(f"{native}i4,f8")[0] == native
+        with pytest.raises(ValueError):
+            NumPyParser.decode(f"{other}i4,f8")
+        with pytest.raises(ValueError):
+            NumPyParser.decode(f"i4,{other}f8")
+
+    def test_decode_byte_order_after_shape(self):
+        (specifier, shape) = NumPyParser.decode("(2,3)<i2")[1]
+        assert (specifier.character, shape) == ("i2", (2, 3))
+        assert NumPyParser.decode("(2,)>i4,>f8")[0] == ">"
+        with pytest.raises(ValueError):
+            NumPyParser.decode(">(2,3)<i2")
+
     @pytest.mark.parametrize(
         "spec, expected",
         [
@@ -150,7 +169,7 @@ class TestStructParser:
             ([get_spec("timedelta", 8), ()], "m"),
             ([get_spec("datetime", 8), ()], "M"),
             ([get_spec("bytes", 1), (1,)], "S1"),
-            ([get_spec("str", 1), (2,)], "U2"),
+            ([get_spec("str", 4), (2,)], "U2"),
         ],
     )
     def test_encode_single_format(self, spec, expected):
@@ -183,7 +202,7 @@ class TestStructParser:
                 [(get_spec("datetime", 8), ()), (get_spec("bytes", 1), (1,))],
                 "M,S1",
             ),
-            ([(get_spec("str", 1), (2,)), (get_spec("str", 1), (3,))], "U2,U3"),
+            ([(get_spec("str", 4), (2,)), (get_spec("str", 4), (3,))], "U2,U3"),
         ],
     )
     def test_encode_multiple_format(self, spec, expected):
@@ -209,7 +228,7 @@ class TestStructParser:
             ([get_spec("timedelta", 8), (3,)], "(3,)m"),
             ([get_spec("datetime", 8), (31,)], "(31,)M"),
             ([get_spec("bytes", 1), (3, 4)], "(4,)S3"),
-            ([get_spec("str", 1), (90, 3, 4)], "(3,4)U90"),
+            ([get_spec("str", 4), (90, 3, 4)], "(3,4)U90"),
         ],
     )
     def test_encode_single_array(self, spec, expected):
@@ -252,10 +271,93 @@ class TestStructParser:
                 "(3,7)M,(9,)S7",
             ),
             (
-                [(get_spec("str", 1), (3, 7, 9)), (get_spec("str", 1), (7, 9))],
+                [(get_spec("str", 4), (3, 7, 9)), (get_spec("str", 4), (7, 9))],
                 "(7,9)U3,(9,)U7",
             ),
         ],
     )
     def test_encode_multiple_array(self, spec, expected):
         assert NumPyParser.encode(*spec) == expected
+
+
+class TestNumPyRecord:
+    def test_decode_comma_separated(self):
+        record = NumPyParser.decode_record("<i4,<(3,)f8,S5")
+        assert [(f.name, f.offset, f.shape, f.endian) for f in record.fields] == [
+            ("f0", 0, (), "<"),
+            ("f1", 4, (3,), "<"),
+            ("f2", 28, (5,), "<"),
+        ]
+        assert record.itemsize == 33
+
+    def test_decode_list(self):
+        record = NumPyParser.decode_record(
+            [
+                ("time", ">f8"),
+                ("pos", [("x", "f4"), ("y", "f4")], (2,)),
+                ("name", "S4", (3,)),
+            ]
+        )
+        time, pos, name = record.fields
+        assert (time.name, time.offset, time.endian) == ("time", 0, ">")
+        assert (pos.name, pos.offset, pos.shape) == ("pos", 8, (2,))
+        assert [f.name for f in pos.specifier.fields] == ["x", "y"]
+        assert pos.specifier.itemsize == 8
+        assert (name.offset, name.shape) == (24, (4, 3))
+        assert record.itemsize == 36
+        assert record.is_packed
+
+    def test_decode_list_byte_order_after_shape(self):
+        record = NumPyParser.decode_record([("a", "S4", (2,)), ("b", "(2,3)<i2")])
+        assert (record.fields[1].shape, record.fields[1].endian) == ((2, 3), "<")
+        assert record.itemsize == 20
+
+    def test_decode_dict(self):
+        record = NumPyParser.decode_record(
+            {
+                "names": ["flag", "value", "inner"],
+                "formats": ["u1", "<i4", {"names": ["a"], "formats": ["u2"]}],
+                "offsets": [0, 4, 8],
+                "itemsize": 16,
+            }
+        )
+        assert [f.offset for f in record.fields] == [0, 4, 8]
+        assert record.fields[2].specifier.itemsize == 2
+        assert record.itemsize == 16
+        assert not record.is_packed
+
+    def test_encode_list(self):
+        spec = [("time", ">f8"), ("pos", [("x", "f4"), ("y", "f4")], (2,))]
+        record = NumPyParser.decode_record(spec)
+        assert NumPyParser.encode_record(record) == [
+            ("time", ">f8"),
+            ("pos", ([("x", "f4"), ("y", "f4")], (2,))),
+        ]
+
+    def test_encode_dict(self):
+        spec = {
+            "names": ["flag", "value"],
+            "formats": ["B", "<(2,)i4"],
+            "offsets": [0, 4],
+            "itemsize": 16,
+        }
+        record = NumPyParser.decode_record(spec)
+        assert NumPyParser.encode_record(record, "dict") == spec
+
+    def test_encode_padded_as_list(self):
+        record = NumPyParser.decode_record(
+            {"names": ["a", "b"], "formats": ["u1", "i4"], "offsets": [0, 4]}
+        )
+        with pytest.raises(ValueError):
+            NumPyParser.encode_record(record, "list")
+
+    def test_round_trip(self):
+        np = pytest.importorskip("numpy")
+        spec = {
+            "names": ["flag", "pos", "name"],
+            "formats": ["u1", ([("x", "<f4"), ("y", "<f4")], (3,)), "S5"],
+            "offsets": [0, 8, 40],
+            "itemsize": 48,
+        }
+        record = NumPyParser.decode_record(spec)
+        assert np.dtype(NumPyParser.encode_record(record, "dict")) == np.dtype(spec)
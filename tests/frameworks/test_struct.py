@@ -1,6 +1,9 @@
+import struct
+import sys
+
 import pytest
 
-from pydtype.frameworks import StructParser
+from pydtype.frameworks import NumPyParser, StructParser
 
 from ..conftest import get_spec
 
@@ -171,3 +174,98 @@ class TestStructParser:
     )
     def test_encode_multiple_array(self, spec, expected):
         assert StructParser.encode(*spec) == expected
+
+
+class TestStructRecord:
+    @pytest.mark.parametrize(
+        "spec, expected",
+        [
+            ("<i4,(3,)f8,S5", "<i3d5s"),
+            ([("a", ">u1"), ("b", [("x", ">i2"), ("y", "S3")], (2,))], ">Bh3sh3s"),
+            (
+                {"names": ["a", "b"], "formats": ["u1", "<i4"], "offsets": [0, 4]},
+                "<B3xi",
+            ),
+            (
+                {
+                    "names": ["b", "a"],
+                    "formats": ["f8", "u2"],
+                    "offsets": [8, 2],
+                    "itemsize": 24,
+                },
+                "=2xH4xd8x",
+            ),
+        ],
+    )
+    def test_encode_record(self, spec, expected):
+        record = NumPyParser.decode_record(spec)
+        assert StructParser.encode_record(record) == expected
+
+    def test_mixed_byte_order(self):
+        record = NumPyParser.decode_record([("a", "<i4"), ("b", ">i4")])
+        with pytest.raises(ValueError):
+            StructParser.encode_record(record)
+
+    def test_unmarked_is_native(self):
+        native, other = ("<", ">") if sys.byteorder == "little" else (">", "<")
+        record = NumPyParser.decode_record([("a", "u1"), ("b", "i4"), ("c", "i8")])
+        assert StructParser.encode_record(record) == "=Biq"
+        record = NumPyParser.decode_record([("a", "u1"), ("b", f"{native}i4")])
+        assert StructParser.encode_record(record) == f"{native}Bi"
+        # Single bytes have no byte order
+        record = NumPyParser.decode_record([("a", "u1"), ("b", f"{other}i4")])
+        assert StructParser.encode_record(record) == f"{other}Bi"
+        record = NumPyParser.decode_record(
+            [("a", "u1"), ("b", f"{other}i4"), ("c", "i8")]
+        )
+        with pytest.raises(ValueError):
+            StructParser.encode_record(record)
+
+    def test_overlap(self):
+        record = NumPyParser.decode_record(
+            {"names": ["a", "b"], "formats": ["i4", "i4"], "offsets": [0, 2]}
+        )
+        with pytest.raises(ValueError):
+            StructParser.encode_record(record)
+
+
+class TestStructFlatten:
+    @pytest.mark.parametrize(
+        "spec, expected",
+        [
+            ([(get_spec("float", 4), (64, 64))], "4096f"),
+            ([(get_spec("int", 2), (3,))], "3h"),
+            ([(get_spec("bytes", 1), (8, 3, 4))], "96s"),
+            ([(get_spec("bytes", 1), (8, 3))], "24s"),
+            ([(get_spec("float", 8), (1000, 1000, 10))], "10000000d"),
+            (["<", (get_spec("int", 8), ()), (get_spec("uint", 1), (2, 5))], "<q10B"),
+        ],
+    )
+    def test_encode_flatten(self, spec, expected):
+        assert StructParser.encode(*spec, flatten=True) == expected
+
+    def test_encode_without_flatten(self):
+        with pytest.raises(ValueError):
+            StructParser.encode((get_spec("float", 4), (64, 64)))
+
+    def test_encode_flat(self):
+        spec = NumPyParser.decode("<(64,64)f4,<(3,4)S8,<i2")
+        fmt, shapes = StructParser.encode_flat(*spec)
+        assert fmt == "<4096f96sh"
+        # Shape of the string array, without the length of each string
+        assert shapes == [(64, 64), (3, 4), ()]
+
+    def test_encode_flat_strings(self):
+        numpy = pytest.importorskip("numpy")
+        array = numpy.array([[b"a", b"bc", b"def"], [b"g", b"", b"hi"]], "S3")
+        fmt, shapes = StructParser.encode_flat(*NumPyParser.decode("(2,3)S3"))
+        # The array is merged into one string, which is split into items of length
+        (value,) = struct.unpack(fmt, array.tobytes())
+        restored = numpy.frombuffer(value, "S3").reshape(shapes[0])
+        assert (restored == array).all()
+
+    def test_encode_record_flatten(self):
+        record = NumPyParser.decode_record([("a", ("<f4", (2, 2))), ("b", "<i2")])
+        with pytest.raises(ValueError):
+            StructParser.encode_record(record)
+        assert StructParser.encode_record(record, flatten=True) == "<4fh"
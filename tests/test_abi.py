@@ -0,0 +1,79 @@
+import pytest
+
+from pydtype import translate
+from pydtype.abi import ABI, PROFILES, profile
+from pydtype.frameworks import NumPyParser, StructParser
+
+
+class TestProfile:
+    def test_name(self):
+        assert profile("LP64") is PROFILES["lp64"]
+        assert profile(PROFILES["ilp32"]) is PROFILES["ilp32"]
+
+    def test_unknown(self):
+        with pytest.raises(ValueError):
+            profile("lp128")
+
+
+class TestWithABI:
+    def test_cached(self):
+        assert StructParser.with_abi("lp64") is StructParser.with_abi("lp64")
+        assert StructParser.with_abi(None) is StructParser
+
+    @pytest.mark.parametrize(
+        "abi, sizes",
+        [("lp64", [8, 8, 8, 8]), ("llp64", [4, 8, 8, 8]), ("ilp32", [4, 8, 4, 4])],
+    )
+    def test_struct_native(self, abi, sizes):
+        decoded = StructParser.with_abi(abi).decode("@lqnP")
+        assert [s.byte_size for s, _ in decoded[1:]] == sizes
+
+    def test_struct_standard(self):
+        # Standard sizes don't depend on platform
+        decoded = StructParser.with_abi("lp64").decode("<lq")
+        assert [s.byte_size for s, _ in decoded[1:]] == [4, 8]
+        assert StructParser.with_abi("lp64").encode(*decoded) == "<iq"
+
+    def test_numpy(self):
+        decoded = NumPyParser.with_abi("llp64").decode("l,g,p")
+        assert [s.byte_size for s, _ in decoded] == [4, 8, 8]
+
+    def test_long_double(self):
+        # Apple arm64 has no extended precision
+        decoded = NumPyParser.with_abi("darwin-arm64").decode("g")
+        assert decoded[0][0].byte_size == 8
+        assert translate("g", "numpy", "struct", abi="darwin-arm64") == "d"
+
+    def test_custom(self):
+        abi = ABI("lp32", 2, 2, 4, 8, 4, 4, 8)
+        assert translate("i", "struct", "numpy", abi=abi) == "i2"
+
+
+class TestTranslate:
+    @pytest.mark.parametrize(
+        "spec, from_, to, abi, expected",
+        [
+            ("@lq", "struct", "numpy", "llp64", "=i4,=i8"),
+            ("@lq", "struct", "numpy", "lp64", "=i8,=i8"),
+            ("@lN", "struct", "numpy", "ilp32", "=i4,=u4"),
+            ("@lq", "struct", "struct", ("llp64", "lp64"), "@il"),
+            ("l,L", "numpy", "ctypes", "llp64", "c_int32,c_uint32"),
+            ("g", "numpy", "ctypes", "llp64", "c_double"),
+            ("c_long,c_size_t", "ctypes", "numpy", "ilp32", "i4,u4"),
+            ("l", "array", "numpy", "lp64", "=i8"),
+        ],
+    )
+    def test_abi(self, spec, from_, to, abi, expected):
+        assert translate(spec, from_, to, abi=abi) == expected
+
+    def test_default(self):
+        # Without ABI, struct keeps its standard sizes even for native mode
+        assert translate("@l", "struct", "numpy") == "=i4"
+        with pytest.raises(ValueError):
+            translate("@P", "struct", "numpy")
+
+    def test_not_expressible(self):
+        assert translate("c_longdouble", "ctypes", "numpy", abi="ilp32") == "g"
+        # 12-byte long double of i386 has no counterpart on x86-64
+        with pytest.raises(ValueError):
+            translate("c_longdouble", "ctypes", "numpy", abi=("ilp32", "lp64"))
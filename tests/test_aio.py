@@ -0,0 +1,52 @@
+import asyncio
+import socket
+import struct
+
+import pytest
+
+from pydtype.aio import read_records
+
+
+def read_all(payload: bytes, spec: str, from_: str, batch_size: int):
+    async def main():
+        rsock, wsock = socket.socketpair()
+        with rsock, wsock:
+            reader, writer = await asyncio.open_connection(sock=rsock)
+            wsock.sendall(payload)
+            wsock.shutdown(socket.SHUT_WR)
+            batches = [b async for b in read_records(reader, spec, from_, batch_size)]
+            writer.close()
+            return batches
+
+    return asyncio.run(main())
+
+
+class TestReadRecords:
+    @pytest.mark.parametrize(
+        "spec, from_, fmt",
+        [
+            ("<id", "struct", "<id"),
+            # NumPy packs fields, so frames are 12 bytes
+            ("i4,f8", "numpy", "=id"),
+            ("<h5s", "struct", "<h5s"),
+            ("<i3x", "struct", "<i3x"),
+            ("P", "struct", "P"),
+        ],
+    )
+    @pytest.mark.parametrize("batch_size", [1, 3, 10])
+    def test_read_records(self, spec, from_, fmt, batch_size):
+        size = struct.calcsize(fmt)
+        values = [struct.unpack(fmt, bytes(range(i, i + size))) for i in range(7)]
+        payload = b"".join(struct.pack(fmt, *v) for v in values)
+
+        batches = read_all(payload, spec, from_, batch_size)
+        assert all(len(b) <= batch_size for b in batches)
+        assert [r for b in batches for r in b] == values
+
+    def test_empty_stream(self):
+        assert read_all(b"", "<id", "struct", 4) == []
+
+    def test_truncated_record(self):
+        payload = struct.pack("<ii", 1, 2) + b"\x00\x00"
+        with pytest.raises(asyncio.IncompleteReadError):
+            read_all(payload, "<i", "struct", 4)
@@ -0,0 +1,92 @@
+import pytest
+
+from pydtype import SpecBuilder, translate
+from pydtype.core.record import layout
+from pydtype.frameworks.numpy import NumPyTypes
+from pydtype.frameworks.struct import StructTypes
+from pydtype.testing import corpus
+
+
+class TestSpecBuilder:
+    def test_append(self):
+        builder = SpecBuilder("<")
+        assert builder.append(*NumPyTypes.find("i4")) == 0
+        assert builder.encode("numpy") == "<i4"
+        assert builder.append(*NumPyTypes.find("(3,)f8")) == 4
+        assert builder.append(*NumPyTypes.find("S5")) == 28
+        assert builder.encode("numpy") == "<i4,<(3,)f8,<S5"
+        assert builder.encode("struct") == "<i3d5s"
+        assert builder.offsets == (0, 4, 28)
+        assert builder.itemsize == 33
+        assert len(builder) == 3
+
+    def test_aligned(self):
+        builder = SpecBuilder(aligned=True)
+        assert builder.append(*StructTypes.find("b")) == 0
+        assert builder.append(*StructTypes.find("d")) == 8
+        assert builder.append(*StructTypes.find("h")) == 16
+        assert builder.itemsize == 18
+
+    def test_insert_pop(self):
+        builder = SpecBuilder.decode("<hd", "struct")
+        assert builder.encode("numpy") == "<i2,<f8"
+        assert builder.insert(1, *StructTypes.find("4s")) == 2
+        assert builder.offsets == (0, 2, 6)
+        assert builder.encode("numpy") == "<i2,<S4,<f8"
+        assert builder.insert(-10, *StructTypes.find("B")) == 0
+        assert builder.encode("struct") == "<Bh4sd"
+
+        assert builder.pop(-2) == StructTypes.find("4s")
+        assert builder.pop(0) == StructTypes.find("B")
+        assert builder.offsets == (0, 2)
+        assert builder.itemsize == 10
+        assert builder.encode("numpy") == "<i2,<f8"
+        with pytest.raises(IndexError):
+            builder.pop(5)
+
+    def test_endian(self):
+        builder = SpecBuilder.decode("i4,f8", "numpy")
+        assert builder.encode("struct") == "id"
+        builder.endian = ">"
+        assert builder.encode("struct") == ">id"
+        assert builder.encode("numpy") == ">i4,>f8"
+        assert builder.decoded[0] == ">"
+
+    def test_unexpressible(self):
+        builder = SpecBuilder.decode("i4", "numpy")
+        assert builder.encode("struct") == "i"
+        builder.append(*NumPyTypes.find("c16"))
+        with pytest.raises(ValueError):
+            builder.encode("struct")
+        builder.pop()
+        assert builder.encode("struct") == "i"
+
+    def test_sizes(self):
+        builder = SpecBuilder.decode("<B3xi4x", "struct")
+        assert (builder.offsets, builder.itemsize) == ((0, 1, 4, 8), 12)
+        # NumPy stores 4 bytes per character
+        assert SpecBuilder.decode("<U3,<i4", "numpy").offsets == (0, 12)
+        with pytest.raises(ValueError):
+            SpecBuilder.decode("O", "numpy")
+
+    @pytest.mark.parametrize("from_", ["numpy", "struct"])
+    def test_equals_translate(self, from_):
+        for spec in corpus(from_, size=20, max_fields=20, portable=True):
+            expected = {to: translate(spec, from_, to) for to in ("numpy", "struct")}
+            builder = SpecBuilder.decode(spec, from_)
+            for to in expected:
+                assert builder.encode(to) == expected[to]
+            fields = [s for s in builder.decoded if not isinstance(s, str)]
+            assert (list(builder.offsets), builder.itemsize) == layout(
+                *fields, aligned=builder.aligned
+            )
+
+            # Rebuild back to front, through insertion
+            rebuilt = SpecBuilder(builder.endian, builder.aligned)
+            for to in expected:
+                rebuilt.encode(to)
+            for entry in reversed(list(builder)):
+                rebuilt.insert(0, *entry)
+            assert rebuilt.offsets == builder.offsets
+            for to in expected:
+                assert rebuilt.encode(to) == expected[to]
@@ -0,0 +1,63 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pydtype
+from pydtype import instrumentation
+from pydtype.abi import ABI
+from pydtype.frameworks import NumPyParser
+from pydtype.frameworks.ctypes import structure
+
+SPECS = [
+    ("<i4,(3,)f8,S5", "numpy", "struct"),
+    ("hq5s", "struct", "numpy"),
+    ("1J,10E,20A", "fits", "numpy"),
+    ("c_int32,c_double*3", "ctypes", "struct"),
+    ("f8", "numpy", "array"),
+] * 200
+
+
+def translate_all(specs):
+    return [pydtype.translate(*spec) for spec in specs]
+
+
+class TestThreads:
+    def test_translate(self):
+        expected = translate_all(SPECS)
+        with ThreadPoolExecutor(32) as executor:
+            results = list(executor.map(lambda spec: pydtype.translate(*spec), SPECS))
+        assert results == expected
+
+    def test_structure_cache(self):
+        # Spec no other test uses, so that all threads miss the cache together
+        barrier = threading.Barrier(16)
+
+        def create(_):
+            barrier.wait()
+            return structure("<hq7s", "struct")
+
+        with ThreadPoolExecutor(16) as executor:
+            classes = set(executor.map(create, range(16)))
+        assert len(classes) == 1
+
+    def test_with_abi_cache(self):
+        # ABI no other test uses, so that all threads miss the cache together
+        abi = ABI("test-concurrency", 2, 4, 4, 8, 4, 4, 8)
+        barrier = threading.Barrier(16)
+
+        def create(_):
+            barrier.wait()
+            return NumPyParser.with_abi(abi)
+
+        with ThreadPoolExecutor(16) as executor:
+            classes = set(executor.map(create, range(16)))
+        assert len(classes) == 1
+        assert classes.pop().table is NumPyParser.table.with_abi(abi)
+
+    def test_instrumentation(self):
+        with instrumentation.profile() as stats:
+            with ThreadPoolExecutor(16) as executor:
+                list(executor.map(lambda spec: pydtype.translate(*spec), SPECS))
+        snapshot = stats.snapshot()
+        assert snapshot["stages"]["translate"]["count"] == len(SPECS)
+        total = sum(sum(h.values()) for h in snapshot["frameworks"].values())
+        assert total == len(SPECS)
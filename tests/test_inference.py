@@ -0,0 +1,84 @@
+import array
+
+import pytest
+
+import pydtype
+
+
+class TestInfer:
+    @pytest.mark.parametrize(
+        "data, to, expected",
+        [
+            ([0, 255], "numpy", "B"),
+            ([0, 256], "numpy", "u2"),
+            ([-128, 127], "numpy", "b"),
+            ([-129, 0], "numpy", "i2"),
+            ([-1, 2**31 - 1], "numpy", "i4"),
+            ([0, 2**63], "numpy", "u8"),
+            ([-1, -2], "struct", "b"),
+            ([True, False], "numpy", "?"),
+            ([0.5, 1.5, float("inf"), float("nan")], "numpy", "f2"),
+            ([0.1], "numpy", "f8"),
+            ([1e5, 2], "numpy", "f4"),
+            ([1e5, 2], "fits", "1E"),
+            ([2**24 + 1, 0.5], "numpy", "f8"),
+            ([b"a", b"abcd"], "numpy", "S4"),
+            ([b"a", b"abcd"], "struct", "4s"),
+            (["ab", "abc"], "numpy", "U3"),
+            ([b""], "numpy", "S1"),
+        ],
+    )
+    def test_values(self, data, to, expected):
+        assert pydtype.infer(data, to) == expected
+
+    def test_columns(self):
+        data = {"count": [0, 300], "ratio": [0.5, 0.25], "name": [b"a", b"abc"]}
+        assert pydtype.infer(data) == "u2,f2,S3"
+        assert pydtype.infer(data, "struct") == "He3s"
+
+    @pytest.mark.parametrize(
+        "data, expected",
+        [
+            (array.array("d", [1.0, 2.5]), "f2"),
+            (array.array("q", [-5, 1000]), "i2"),
+            (b"\x00\xff", "B"),
+        ],
+    )
+    def test_buffer(self, data, expected):
+        assert pydtype.infer(data) == expected
+
+    @pytest.mark.parametrize(
+        "data", [[], [2**64], [object()], {}, [2**53 + 1, 0.5]]
+    )
+    def test_unsupported(self, data):
+        with pytest.raises(ValueError):
+            pydtype.infer(data)
+
+
+class TestInferNumPy:
+    @pytest.fixture(autouse=True)
+    def numpy(self):
+        return pytest.importorskip("numpy")
+
+    @pytest.mark.parametrize("chunk_size", [7, 1 << 20])
+    def test_chunks(self, numpy, chunk_size):
+        data = numpy.zeros(100, dtype="i8")
+        data[57] = -40000
+        assert pydtype.infer(data, chunk_size=chunk_size) == "i4"
+
+    def test_float(self, numpy):
+        assert pydtype.infer(numpy.array([0.5, numpy.nan])) == "f2"
+        assert pydtype.infer(numpy.array([0.1], dtype="f4")) == "f4"
+        assert pydtype.infer(numpy.array([0.1])) == "f8"
+
+    def test_structured(self, numpy):
+        data = numpy.array([(1, 0.5, b"ab")], dtype="i8,f8,S10")
+        assert pydtype.infer(data, "struct") == "Be2s"
+
+    def test_subarray(self, numpy):
+        data = numpy.zeros(4, dtype="(3,)f8,i4")
+        assert pydtype.infer(data) == "(3,)f2,B"
+        assert pydtype.infer(numpy.full((4, 2), b"ab")) == "(2,)S2"
+
+    def test_empty_bytes(self, numpy):
+        assert pydtype.infer(numpy.array([b""])) == pydtype.infer([b""]) == "S1"
@@ -0,0 +1,90 @@
+import pytest
+
+import pydtype
+from pydtype import instrumentation
+from pydtype.core import types
+
+
+class TestProfile:
+    def test_disabled_by_default(self):
+        events = []
+        hook = instrumentation.register(lambda *args: events.append(args))
+        try:
+            pydtype.translate("i4", "numpy", "struct")
+        finally:
+            instrumentation.unregister(hook)
+        assert events == []
+
+    def test_stages(self):
+        with instrumentation.profile() as stats:
+            pydtype.translate("<i4,(3,)f8", "numpy", "struct")
+            pydtype.translate("hq", "struct", "numpy", strategy="closest")
+        snapshot = stats.snapshot()
+
+        stages = snapshot["stages"]
+        assert {"translate", "decode", "encode", "find", "match"} <= stages.keys()
+        assert stages["translate"]["count"] == 2
+        assert stages["find"]["count"] == 4
+        assert stages["translate"]["total"] >= stages["decode"]["total"]
+
+        assert sum(snapshot["frameworks"]["numpy->struct"].values()) == 1
+        assert sum(snapshot["frameworks"]["struct->numpy"].values()) == 1
+        assert set(snapshot["strategies"]) == {"exact", "closest"}
+        assert {s["spec"] for s in snapshot["slowest"]} == {"<i4,(3,)f8", "hq"}
+        assert not instrumentation.enabled
+
+    def test_slowest_is_bounded(self):
+        with instrumentation.profile(instrumentation.Statistics(slowest=3)) as stats:
+            for _ in range(10):
+                pydtype.translate("f8", "numpy", "struct")
+        slowest = stats.snapshot()["slowest"]
+        assert len(slowest) == 3
+        assert slowest == sorted(slowest, key=lambda s: s["elapsed"], reverse=True)
+
+    def test_failed_translation_is_recorded(self):
+        with instrumentation.profile() as stats:
+            with pytest.raises(ValueError):
+                pydtype.translate("c32", "numpy", "struct")
+        assert stats.snapshot()["stages"]["encode"]["count"] == 1
+
+    def test_nested(self):
+        with instrumentation.profile() as outer:
+            with instrumentation.profile():
+                pass
+            # Still enabled until the outer block exits
+            pydtype.translate("d", "struct", "numpy")
+        assert outer.snapshot()["stages"]["translate"]["count"] == 1
+        assert not instrumentation.enabled
+
+    def test_unwrapped_when_disabled(self):
+        match, lookup = types.match, types.Types.lookup
+        with instrumentation.profile():
+            assert types.match is not match
+            assert types.Types.lookup != lookup
+        assert types.match is match
+        assert types.Types.lookup == lookup
+
+    def test_hook(self):
+        events = []
+
+        @instrumentation.register
+        def hook(stage, elapsed, info):
+            events.append((stage, info.get("from_")))
+
+        try:
+            with instrumentation.profile():
+                pydtype.translate("d", "struct", "numpy")
+        finally:
+            instrumentation.unregister(hook)
+        assert ("translate", "struct") in events
+        assert ("find", None) in events
+
+
+def test_default_statistics():
+    instrumentation.statistics.reset()
+    instrumentation.enable()
+    try:
+        pydtype.translate("d", "struct", "numpy")
+    finally:
+        instrumentation.disable()
+    assert instrumentation.snapshot()["stages"]["translate"]["count"] == 1
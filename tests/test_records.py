@@ -0,0 +1,107 @@
+import io
+import struct
+
+import pytest
+
+import pydtype
+from pydtype.records import compile_struct
+
+RECORDS = [(i, i / 4, b"r%03d" % i) for i in range(10)]
+
+
+class TestPackRecords:
+    @pytest.mark.parametrize(
+        "spec, from_, fmt",
+        [
+            ("<id4s", "struct", "<id4s"),
+            (">i4,>f8,S4", "numpy", ">id4s"),
+            ("did4s", "struct", "did4s"),
+        ],
+    )
+    @pytest.mark.parametrize("chunk_size", [1, 3, 4096])
+    def test_tuples(self, spec, from_, fmt, chunk_size):
+        records = [(0.5, *r) for r in RECORDS] if fmt.startswith("d") else RECORDS
+        packed = pydtype.pack_records(records, spec, from_, chunk_size=chunk_size)
+        assert isinstance(packed, bytearray)
+        assert packed == b"".join(struct.pack(fmt, *r) for r in records)
+
+    def test_packed_spec(self):
+        # NumPy packs fields, while struct format without byte order is aligned
+        expected = struct.pack("=id", 1, 2.0) + struct.pack("=id", 3, 4.0)
+        tuples = pydtype.pack_records([(1, 2.0), (3, 4.0)], "i4,f8", "numpy")
+        columns = pydtype.pack_records({"a": [1, 3], "b": [2.0, 4.0]}, "i4,f8", "numpy")
+        assert bytes(tuples) == bytes(columns) == expected
+
+    def test_aligned_records(self):
+        # "ib" is 5 bytes, while repeating the format would align each "i"
+        packed = pydtype.pack_records([(1, 2), (3, 4)], "ib", "struct")
+        assert packed == struct.pack("ib", 1, 2) + struct.pack("ib", 3, 4)
+
+    def test_columns(self):
+        columns = {"a": [1, 2, 3], "b": [0.5, 1.5, 2.5]}
+        packed = pydtype.pack_records(columns, "<hd", "struct")
+        assert bytes(packed) == struct.pack("<hdhdhd", 1, 0.5, 2, 1.5, 3, 2.5)
+
+    def test_out(self):
+        out = bytearray(200)
+        view = pydtype.pack_records(RECORDS, "<id4s", "struct", out=out)
+        size = compile_struct("<id4s", "struct").size
+        assert view.nbytes == size * len(RECORDS)
+        expected = b"".join(struct.pack("<id4s", *r) for r in RECORDS)
+        assert out[: view.nbytes] == expected
+        assert out[view.nbytes :] == bytes(200 - view.nbytes)
+
+    def test_out_too_small(self):
+        with pytest.raises(ValueError):
+            pydtype.pack_records(RECORDS, "<id4s", "struct", out=bytearray(10))
+
+    @pytest.mark.parametrize("chunk_size", [1, 4, 4096])
+    def test_file(self, chunk_size):
+        file, records = io.BytesIO(), iter(RECORDS)
+        written = pydtype.pack_records(
+            records, "<id4s", "struct", file=file, chunk_size=chunk_size
+        )
+        expected = b"".join(struct.pack("<id4s", *r) for r in RECORDS)
+        assert written == len(expected)
+        assert file.getvalue() == expected
+
+
+class TestPackNumPy:
+    @pytest.fixture(autouse=True)
+    def numpy(self):
+        return pytest.importorskip("numpy")
+
+    def test_columns(self, numpy):
+        columns = {"a": numpy.arange(5), "b": numpy.linspace(0, 1, 5)}
+        packed = pydtype.pack_records(columns, "<i4,<f8", "numpy")
+        expected = b"".join(struct.pack("<id", a, b) for a, b in zip(*columns.values()))
+        assert bytes(packed) == expected
+
+    def test_structured_array(self, numpy):
+        array = numpy.array(RECORDS, dtype="i8,f4,S4")
+        file = io.BytesIO()
+        pydtype.pack_records(array, ">id4s", "struct", file=file, chunk_size=3)
+        assert file.getvalue() == b"".join(struct.pack(">id4s", *r) for r in RECORDS)
+
+    def test_native_alignment(self, numpy):
+        columns = {"a": [1, 2], "b": [3, 4]}
+        packed = pydtype.pack_records(columns, "bi", "struct")
+        assert bytes(packed) == struct.pack("bi", 1, 3) + struct.pack("bi", 2, 4)
+
+    @pytest.mark.parametrize(
+        "spec, columns",
+        [
+            ("<i3x", {"a": [1, 2]}),
+            ("<bx3xi", {"a": [1, 2], "b": [3, 4]}),
+            ("bxi", {"a": [1, 2], "b": [3, 4]}),
+        ],
+    )
+    def test_pad_bytes(self, numpy, monkeypatch, spec, columns):
+        out = bytearray(b"\xff" * 32)
+        packed = pydtype.pack_records(columns, spec, "struct", out=out)
+        monkeypatch.setattr(pydtype.records, "_use_numpy", lambda records: False)
+        expected = pydtype.pack_records(columns, spec, "struct")
+        assert bytes(packed) == bytes(expected)
+        assert bytes(packed) == b"".join(
+            struct.pack(spec, *r) for r in zip(*columns.values())
+        )
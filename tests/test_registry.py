@@ -0,0 +1,96 @@
+import multiprocessing
+import struct
+import sys
+
+import pytest
+
+from pydtype.registry import SchemaRegistry, SharedSchemaRegistry
+
+SPECS = [
+    ("<i4,(3,)f8,S5", "numpy"),
+    ("bid", "struct"),
+    ("<bid", "struct"),
+    ("1J,10E,20A", "fits"),
+    ("c16", "numpy"),
+]
+
+
+@pytest.fixture
+def registry():
+    registry = SchemaRegistry()
+    for spec in SPECS:
+        registry.add(*spec)
+    return registry
+
+
+def lookup(name, spec, from_):
+    shared = SharedSchemaRegistry.attach(name)
+    try:
+        schema = shared.get(spec, from_)
+        return schema.itemsize, schema.translations["struct"]
+    finally:
+        shared.close()
+
+
+class TestSchemaRegistry:
+    def test_add(self, registry):
+        schema = registry.get("<i4,(3,)f8,S5", "numpy")
+        assert schema.itemsize == 33
+        assert schema.offsets == (0, 4, 28)
+        assert schema.translations["struct"] == "<i3d5s"
+        assert schema.translations["ctypes"] == "c_int32,c_double*3,c_char*5"
+
+    def test_native_alignment(self, registry):
+        assert registry.get("bid", "struct").offsets == (0, 4, 8)
+        assert registry.get("bid", "struct").itemsize == struct.calcsize("bid")
+        assert registry.get("<bid", "struct").offsets == (0, 1, 5)
+
+    def test_sizes(self):
+        registry = SchemaRegistry()
+        # NumPy stores 4 bytes per character
+        assert registry.add("<U3,<i4", "numpy").offsets == (0, 12)
+        assert registry.get("<U3,<i4", "numpy").itemsize == 16
+        assert registry.add("<i3x", "struct").itemsize == struct.calcsize("<i3x")
+        with pytest.raises(ValueError):
+            registry.add("O", "numpy")
+        assert ("O", "numpy") not in registry
+
+    def test_untranslatable_target_is_skipped(self, registry):
+        assert "struct" not in registry.get("c16", "numpy").translations
+        assert "numpy" in registry.get("c16", "numpy").translations
+
+    def test_round_trip(self, registry):
+        shared = SharedSchemaRegistry(registry.dumps())
+        assert len(shared) == len(SPECS)
+        for spec in SPECS:
+            assert spec in shared
+            assert shared.get(*spec) == registry.get(*spec)
+        assert ("i4", "numpy") not in shared
+        with pytest.raises(KeyError):
+            shared.get("i4", "numpy")
+
+    def test_read_only(self, registry):
+        shared = SharedSchemaRegistry(bytearray(registry.dumps()))
+        with pytest.raises(TypeError):
+            shared._buffer[0] = 0
+
+    def test_invalid_buffer(self):
+        with pytest.raises(ValueError):
+            SharedSchemaRegistry(bytes(64))
+
+
+@pytest.mark.skipif(
+    sys.version_info < (3, 8), reason="multiprocessing.shared_memory is Python 3.8+"
+)
+def test_shared_memory(registry):
+    shm = registry.publish()
+    try:
+        context = multiprocessing.get_context("spawn")
+        with context.Pool(2) as pool:
+            results = pool.starmap(lookup, [(shm.name, *SPECS[0])] * 4)
+        assert results == [(33, "<i3d5s")] * 4
+
+        assert lookup(shm.name, "<bid", "struct") == (13, "<bid")
+    finally:
+        shm.close()
+        shm.unlink()
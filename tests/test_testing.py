@@ -0,0 +1,55 @@
+import pytest
+
+from pydtype import testing
+
+
+class TestCorpus:
+    @pytest.mark.parametrize("from_", ["numpy", "struct"])
+    def test_reproducible(self, from_):
+        assert testing.corpus(from_, 20, seed=3) == testing.corpus(from_, 20, seed=3)
+        assert testing.corpus(from_, 20, seed=3) != testing.corpus(from_, 20, seed=4)
+
+    @pytest.mark.parametrize("from_", ["numpy", "struct"])
+    def test_max_fields(self, from_):
+        for spec in testing.corpus(from_, 50, max_fields=5):
+            decoded = testing.framework[from_].decode(spec)
+            assert 1 <= len([s for s in decoded if not isinstance(s, str)]) <= 5
+
+
+class TestConformance:
+    @pytest.mark.parametrize("seed", range(4))
+    @pytest.mark.parametrize("portable", [False, True])
+    def test_numpy(self, seed, portable):
+        for spec in testing.corpus("numpy", 100, seed=seed, portable=portable):
+            testing.check(spec, "numpy")
+
+    @pytest.mark.parametrize("seed", range(4))
+    def test_struct(self, seed):
+        for spec in testing.corpus("struct", 100, seed=seed):
+            testing.check(spec, "struct")
+
+    @pytest.mark.parametrize(
+        "spec, from_", [("U3", "numpy"), ("<(2,3)U2,<i4", "numpy"), ("<i3x", "struct")]
+    )
+    def test_unicode_and_pad_bytes(self, spec, from_):
+        testing.check(spec, from_)
+
+    def test_portable_struct(self):
+        assert any("x" in s for s in testing.corpus("struct", 20))
+        assert not any("x" in s for s in testing.corpus("struct", 20, portable=True))
+
+    def test_wide_record(self):
+        spec = "<" + "i3d5s" * 2000
+        testing.check(spec, "struct")
+        assert testing.itemsize(spec, "struct") == 2000 * (4 + 24 + 5)
+
+    def test_detects_mismatch(self):
+        # Native alignment pads "b" to 4 bytes, which decoded spec doesn't express
+        with pytest.raises(AssertionError):
+            testing.check("@bi", "struct")
+
+    def test_reports_translation_error(self):
+        # Only specs not expressible in the target are skipped
+        testing.check("<c16", "numpy", to=("struct",))
+        with pytest.raises(AssertionError):
+            testing.check("<i4", "numpy", to=("unknown",))
@@ -67,3 +67,13 @@ class TestTranslate:
     )
     def test_translate_multiple_array(self, input_, from_, to, expected):
         assert pydtype.translate(input_, from_, to) == expected
+
+    def test_translate_flatten(self):
+        with pytest.raises(ValueError):
+            pydtype.translate("<(64,64)f4,<i2", "numpy", "struct")
+        assert (
+            pydtype.translate("<(64,64)f4,<i2", "numpy", "struct", flatten=True)
+            == "<4096fh"
+        )
+        with pytest.raises(ValueError):
+            pydtype.translate("(2,2)f4", "numpy", "numpy", flatten=True)
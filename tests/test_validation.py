@@ -0,0 +1,119 @@
+import random
+
+import pytest
+
+from pydtype import testing, translate
+from pydtype.core import Parser
+from pydtype.frameworks import StructParser
+from pydtype.translator import framework
+from pydtype.validation import Error, Result, try_decode, try_translate, validate
+
+
+def corrupt(spec: str, rng: random.Random) -> str:
+    i = rng.randrange(len(spec))
+    return spec[:i] + rng.choice("zZ<>!@|,()0$ ") + spec[i + 1 :]
+
+
+class UntokenizedParser(Parser):
+
+    framework = "untokenized"
+    table = StructParser.table
+
+    @classmethod
+    def encode(cls, *spec, strategy="exact"):
+        return StructParser.encode(*spec, strategy=strategy)
+
+    @classmethod
+    def decode(cls, spec):
+        return StructParser.decode(spec)
+
+
+class TestTryTranslate:
+    @pytest.mark.parametrize(
+        "spec, from_, to, expected",
+        [
+            ("<i4,(3,)f8", "numpy", "struct", Result("<i3d")),
+            ("<i4,zz", "numpy", "struct", Result(None, Error.UNSUPPORTED, 4)),
+            ("<i4, >f8", "numpy", "struct", Result(None, Error.BYTE_ORDER, 5)),
+            ("i<h", "struct", "numpy", Result(None, Error.BYTE_ORDER, 1)),
+            ("i4,c16", "numpy", "struct", Result(None, Error.NOT_EXPRESSIBLE, 3)),
+            ("i4,f8", "numpy", "array", Result(None, Error.NOT_EXPRESSIBLE)),
+            ("1J, 3Y", "fits", "numpy", Result(None, Error.UNSUPPORTED, 4)),
+            ("+s{i,+w:3{q}}", "arrow", "numpy", Result(None, Error.UNSUPPORTED, 5)),
+            ("i4", "numpy", "unknown", Result(None, Error.UNKNOWN_FRAMEWORK)),
+            ("i4", "unknown", "numpy", Result(None, Error.UNKNOWN_FRAMEWORK)),
+        ],
+    )
+    def test_result(self, spec, from_, to, expected):
+        assert try_translate(spec, from_, to) == expected
+
+    @pytest.mark.parametrize("from_", ["numpy", "struct"])
+    def test_equals_raising(self, from_):
+        rng = random.Random(0)
+        for spec in testing.corpus(from_, size=50, max_fields=10):
+            for candidate in [spec, corrupt(spec, rng)]:
+                try:
+                    decoded = framework[from_].decode(candidate)
+                except ValueError:
+                    decoded = None
+                result = try_decode(candidate, from_)
+                assert result.value == decoded
+                assert result.ok == (decoded is not None)
+
+                for to in framework:
+                    try:
+                        expected = translate(candidate, from_, to)
+                    except ValueError:
+                        expected = None
+                    result = try_translate(candidate, from_, to)
+                    assert result.value == expected
+                    assert result.ok == (expected is not None)
+
+    def test_unwrap(self):
+        assert try_translate("i4", "numpy", "struct").unwrap() == "i"
+        with pytest.raises(ValueError, match="UNSUPPORTED at position 4"):
+            try_translate("<i4,zz", "numpy", "struct").unwrap()
+
+
+class TestTryDecode:
+    def test_without_tokenize(self, monkeypatch):
+        monkeypatch.setitem(framework, "untokenized", UntokenizedParser)
+        assert try_decode("<i", "untokenized").ok
+        assert try_decode("<z", "untokenized") == Result(None, Error.UNSUPPORTED)
+
+
+class TestValidate:
+    def test_sizes(self):
+        results = validate(
+            ["<i4", "<f8", "O", "<f8", "bh", "zz"],
+            "numpy",
+            sizes=[8, 12, 8, 16, 6, 1],
+        )
+        assert results == [
+            Result(4),
+            Result(None, Error.SIZE_MISMATCH),
+            Result(None, Error.UNKNOWN_SIZE, 0),
+            Result(8),
+            Result(3),
+            Result(None, Error.UNSUPPORTED, 0),
+        ]
+
+    def test_unicode(self):
+        # NumPy stores 4 bytes per character
+        assert validate(["U3", "U3"], "numpy", sizes=[3, 24]) == [
+            Result(None, Error.SIZE_MISMATCH),
+            Result(12),
+        ]
+
+    def test_pad_bytes(self):
+        assert validate(["<B3xi4x"], "struct") == [Result(12)]
+
+    def test_aligned(self):
+        assert validate(["bd", "=bd"], "struct") == [Result(16), Result(9)]
+
+    def test_equals_layout(self):
+        specs = testing.corpus("numpy", size=50, max_fields=10, portable=True)
+        results = validate(specs, "numpy")
+        assert [r.value for r in results] == [
+            testing.itemsize(s, "numpy") for s in specs
+        ]